@@ -52,11 +52,12 @@ def main() -> None:
     response = session.get(f"{NETBOX_URL}/api/dcim/sites/")
     response.raise_for_status()
     sites: list[dict] = response.json()["results"]
-    for site in sites:
-        print(f"  Site: {site['name']} (slug: {site['slug']})")
+    # Build every line first and write them in one call instead of one
+    # print() per row -- noticeably faster on large NetBox inventories.
+    lines: list[str] = [f"  Site: {site['name']} (slug: {site['slug']})" for site in sites]
     if not sites:
-        print("  No sites found. Create one in the NetBox UI first.")
-    print()
+        lines.append("  No sites found. Create one in the NetBox UI first.")
+    sys.stdout.write("\n".join(lines) + "\n\n")
 
     # -------------------------------------------------------------------------
     # Exercise 2: GET active devices
@@ -68,13 +69,14 @@ def main() -> None:
     )
     response.raise_for_status()
     devices: list[dict] = response.json()["results"]
+    lines = []
     for device in devices:
         site_name: str = device["site"]["name"] if device.get("site") else "N/A"
         status: str = device["status"]["value"] if isinstance(device["status"], dict) else str(device["status"])
-        print(f"  {device['name']:20s} | {status:10s} | {site_name}")
+        lines.append(f"  {device['name']:20s} | {status:10s} | {site_name}")
     if not devices:
-        print("  No active devices found.")
-    print()
+        lines.append("  No active devices found.")
+    sys.stdout.write("\n".join(lines) + "\n\n")
 
     # -------------------------------------------------------------------------
     # Exercise 3: GET all IP addresses
@@ -83,16 +85,17 @@ def main() -> None:
     response = session.get(f"{NETBOX_URL}/api/ipam/ip-addresses/")
     response.raise_for_status()
     ips: list[dict] = response.json()["results"]
+    lines = []
     for ip in ips:
         address: str = ip["address"]
         if ip.get("assigned_object"):
             iface: str = ip["assigned_object"].get("display", "unknown")
-            print(f"  {address:20s} - assigned to: {iface}")
+            lines.append(f"  {address:20s} - assigned to: {iface}")
         else:
-            print(f"  {address:20s} - unassigned")
+            lines.append(f"  {address:20s} - unassigned")
     if not ips:
-        print("  No IP addresses found.")
-    print()
+        lines.append("  No IP addresses found.")
+    sys.stdout.write("\n".join(lines) + "\n\n")
 
     # -------------------------------------------------------------------------
     # Exercise 4: POST a new device
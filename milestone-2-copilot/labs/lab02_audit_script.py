@@ -26,14 +26,17 @@ import argparse
 import json
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import Callable
 
-import yaml
 from netmiko import ConnectHandler, NetmikoAuthenticationException, NetmikoTimeoutException
-from rich.console import Console
-from rich.table import Table
+
+# yaml and rich are imported inside the functions that use them, so importing
+# this module or running --help does not pay their start-up cost.
 
 
 # ---------------------------------------------------------------------------
@@ -74,6 +77,31 @@ class DeviceInfo:
     device_type: str = "arista_eos"
 
 
+@dataclass
+class ParsedConfig:
+    """Audit-relevant values extracted from a device's running-config."""
+    ntp_servers: list[str] = field(default_factory=list)
+    dns_servers: list[str] = field(default_factory=list)
+    snmp_communities: list[str] = field(default_factory=list)
+    syslog_hosts: list[str] = field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Audit Constants
+# ---------------------------------------------------------------------------
+
+# Community strings that should never be used in production.
+BAD_COMMUNITIES: frozenset[str] = frozenset(
+    {"public", "private", "community", "test", "default"}
+)
+
+# Default upper bound on concurrent SSH sessions (override with --workers).
+MAX_WORKERS: int = 32
+
+# Serializes console output from the audit worker threads.
+PRINT_LOCK = threading.Lock()
+
+
 # ---------------------------------------------------------------------------
 # Inventory Loading
 # ---------------------------------------------------------------------------
@@ -92,6 +120,8 @@ def load_inventory(inventory_path: Path) -> list[DeviceInfo]:
     If username/password are not in the YAML, fall back to the
     DEVICE_USERNAME and DEVICE_PASSWORD environment variables.
     """
+    import yaml
+
     # TODO 1: Load the YAML file and return a list of DeviceInfo objects.
     #
     # Steps:
@@ -127,126 +157,151 @@ def connect_to_device(device: DeviceInfo) -> ConnectHandler | None:
     #   3. Try to create a ConnectHandler with the connection dict
     #   4. Catch NetmikoTimeoutException -> print a warning, return None
     #   5. Catch NetmikoAuthenticationException -> print a warning, return None
+    #      (audits run in parallel threads, so wrap prints in PRINT_LOCK)
     #   6. On success, return the ConnectHandler
 
     raise NotImplementedError("TODO 2: Implement connect_to_device()")
 
 
+# ---------------------------------------------------------------------------
+# Config Parsing
+# ---------------------------------------------------------------------------
+
+def parse_running_config(config: str) -> ParsedConfig:
+    """Extract NTP, DNS, SNMP, and syslog settings in a single pass."""
+    # TODO 3: Parse the running-config text into a ParsedConfig.
+    #
+    # Steps:
+    #   1. Loop over config.splitlines() once, stripping each line
+    #   2. "ntp server <ip>"               -> append <ip> to ntp_servers
+    #   3. "ip name-server [vrf X] <ip>"   -> append the last word to dns_servers
+    #   4. "snmp-server community <str>"   -> append <str> to snmp_communities
+    #   5. "logging host <ip>"             -> append <ip> to syslog_hosts
+    #   6. Return a ParsedConfig holding the four lists
+    #
+    # The check functions below only read these lists, so the config is
+    # scanned once per device rather than once per check.
+
+    raise NotImplementedError("TODO 3: Implement parse_running_config()")
+
+
 # ---------------------------------------------------------------------------
 # Audit Check Functions
 # ---------------------------------------------------------------------------
 
-def check_ntp(connection: ConnectHandler) -> CheckResult:
+def check_ntp(config: ParsedConfig) -> CheckResult:
     """Check that at least one NTP server is configured.
 
-    Run "show running-config section ntp" and look for lines matching
-    "ntp server <ip>".
+    Read the servers parsed from "ntp server <ip>" lines.
     """
-    # TODO 3: Implement NTP check.
+    # TODO 4: Implement NTP check.
     #
     # Steps:
-    #   1. Run "show running-config section ntp" using connection.send_command()
-    #   2. Look for lines that start with "ntp server"
-    #   3. If at least one NTP server line is found:
+    #   1. Read config.ntp_servers (already parsed by audit_device)
+    #   2. If at least one NTP server is found:
     #      - Return CheckResult with status=PASS and detail listing the servers
-    #   4. If no NTP server lines are found:
+    #   3. If no NTP servers are found:
     #      - Return CheckResult with status=FAIL and detail="No NTP servers configured"
     #
     # The check_name should be "NTP".
 
-    raise NotImplementedError("TODO 3: Implement check_ntp()")
+    raise NotImplementedError("TODO 4: Implement check_ntp()")
 
 
-def check_dns(connection: ConnectHandler) -> CheckResult:
+def check_dns(config: ParsedConfig) -> CheckResult:
     """Check that at least one DNS name-server is configured.
 
-    Run "show running-config section name-server" and look for
-    "ip name-server" lines.
+    Read the servers parsed from "ip name-server" lines.
     """
-    # TODO 4: Implement DNS check.
+    # TODO 5: Implement DNS check.
     #
     # Steps:
-    #   1. Run "show running-config section name-server" using send_command()
-    #   2. Look for lines containing "ip name-server"
-    #   3. Extract the server IPs from those lines
-    #   4. Return PASS if at least one name-server is found, FAIL otherwise
-    #   5. Include the found servers (or "No DNS servers configured") in detail
+    #   1. Read config.dns_servers (already parsed by audit_device)
+    #   2. Return PASS if at least one name-server is found, FAIL otherwise
+    #   3. Include the found servers (or "No DNS servers configured") in detail
     #
     # The check_name should be "DNS".
 
-    raise NotImplementedError("TODO 4: Implement check_dns()")
+    raise NotImplementedError("TODO 5: Implement check_dns()")
 
 
-def check_snmp(connection: ConnectHandler) -> CheckResult:
+def check_snmp(config: ParsedConfig) -> CheckResult:
     """Check that no default/weak SNMP community strings are in use.
 
-    Run "show running-config section snmp" and flag community strings
-    that match known-bad values.
+    Flag parsed community strings that match known-bad values.
     """
-    # TODO 5: Implement SNMP check.
+    # TODO 6: Implement SNMP check.
     #
     # Steps:
-    #   1. Define a set of bad community strings: {"public", "private",
-    #      "community", "test", "default"}
-    #   2. Run "show running-config section snmp" using send_command()
-    #   3. Parse lines matching "snmp-server community <string>"
-    #   4. Check if any parsed community string is in the bad set
-    #   5. Return FAIL if any bad strings found, with detail listing them
-    #   6. Return PASS if no bad strings found
-    #   7. If no SNMP config exists at all, return PASS with detail
+    #   1. Use the module-level BAD_COMMUNITIES frozenset (built once, not
+    #      on every call) as the set of known-bad community strings
+    #   2. Read config.snmp_communities (already parsed by audit_device)
+    #   3. Check if any community string (lower-cased) is in the bad set
+    #   4. Return FAIL if any bad strings found, with detail listing them
+    #   5. Return PASS if no bad strings found
+    #   6. If no SNMP config exists at all, return PASS with detail
     #      "No SNMP communities configured"
     #
     # The check_name should be "SNMP".
 
-    raise NotImplementedError("TODO 5: Implement check_snmp()")
+    raise NotImplementedError("TODO 6: Implement check_snmp()")
 
 
-def check_syslog(connection: ConnectHandler) -> CheckResult:
+def check_syslog(config: ParsedConfig) -> CheckResult:
     """Check that at least one syslog (logging) host is configured.
 
-    Run "show running-config section logging" and look for
-    "logging host <ip>" lines.
+    Read the hosts parsed from "logging host <ip>" lines.
     """
-    # TODO 6: Implement syslog check.
+    # TODO 7: Implement syslog check.
     #
     # Steps:
-    #   1. Run "show running-config section logging" using send_command()
-    #   2. Look for lines containing "logging host"
-    #   3. Extract the logging host IPs
-    #   4. Return PASS if at least one logging host is found, FAIL otherwise
-    #   5. Include found hosts (or "No syslog hosts configured") in detail
+    #   1. Read config.syslog_hosts (already parsed by audit_device)
+    #   2. Return PASS if at least one logging host is found, FAIL otherwise
+    #   3. Include found hosts (or "No syslog hosts configured") in detail
     #
     # The check_name should be "Syslog".
 
-    raise NotImplementedError("TODO 6: Implement check_syslog()")
+    raise NotImplementedError("TODO 7: Implement check_syslog()")
 
 
 # ---------------------------------------------------------------------------
 # Audit Orchestration
 # ---------------------------------------------------------------------------
 
-# The list of all checks to run. Each is a callable that takes a
-# ConnectHandler and returns a CheckResult.
-AUDIT_CHECKS: list = [check_ntp, check_dns, check_snmp, check_syslog]
+# The checks to run as (name, check) pairs, in table-column order. Each check
+# is a callable that takes the device's ParsedConfig and returns a
+# CheckResult. Fetching and parsing the config once costs one round-trip per
+# device instead of one per check.
+AUDIT_CHECKS: list[tuple[str, Callable[[ParsedConfig], CheckResult]]] = [
+    ("NTP", check_ntp),
+    ("DNS", check_dns),
+    ("SNMP", check_snmp),
+    ("Syslog", check_syslog),
+]
+
+CHECK_NAMES: list[str] = [name for name, _ in AUDIT_CHECKS]
 
 
 def audit_device(device: DeviceInfo) -> DeviceAudit:
     """Run all audit checks against a single device."""
-    # TODO 7: Orchestrate the audit for one device.
+    # TODO 8: Orchestrate the audit for one device.
     #
     # Steps:
     #   1. Create a DeviceAudit instance with hostname and ip from device
     #   2. Call connect_to_device(device) to get a connection
     #   3. If connection is None, set audit.reachable = False and return
-    #   4. Iterate over AUDIT_CHECKS, calling each with the connection
-    #   5. Append each CheckResult to audit.results
-    #   6. Wrap each check call in a try/except to catch unexpected errors
-    #      - On exception, append a CheckResult with status=ERROR and
-    #        the exception message as detail
-    #   7. Disconnect from the device (connection.disconnect())
-    #   8. Return the DeviceAudit
+    #   4. Run "show running-config" once with connection.send_command()
+    #      and pass the output to parse_running_config()
+    #   5. Iterate over the (name, check_fn) pairs in AUDIT_CHECKS, calling
+    #      each check_fn with that ParsedConfig
+    #   6. Append each CheckResult to audit.results, in AUDIT_CHECKS order
+    #   7. Wrap each check call in a try/except to catch unexpected errors
+    #      - On exception, append a CheckResult with status=ERROR, the
+    #        check's name, and the exception message as detail
+    #   8. Disconnect from the device (connection.disconnect())
+    #   9. Return the DeviceAudit
 
-    raise NotImplementedError("TODO 7: Implement audit_device()")
+    raise NotImplementedError("TODO 8: Implement audit_device()")
 
 
 # ---------------------------------------------------------------------------
@@ -255,27 +310,30 @@ def audit_device(device: DeviceInfo) -> DeviceAudit:
 
 def print_results(audits: list[DeviceAudit]) -> None:
     """Print a summary table of all audit results using rich."""
-    # TODO 8: Build and print a rich Table.
+    from rich.console import Console
+    from rich.table import Table
+
+    # TODO 9: Build and print a rich Table.
     #
     # Steps:
     #   1. Create a rich Console and Table
-    #   2. Add columns: "Device", then one column per check name (NTP, DNS,
-    #      SNMP, Syslog)
+    #   2. Add columns: "Device", then one column per name in CHECK_NAMES
     #   3. For each DeviceAudit:
     #      a. If not reachable, add a row with "UNREACHABLE" in every column
-    #      b. Otherwise, add a row with the status of each check
+    #      b. Otherwise, add a row with the status of each check --
+    #         audit.results[i] lines up with CHECK_NAMES[i]
     #   4. Color-code cells: green for PASS, red for FAIL, yellow for ERROR
     #   5. Print the table to the console
     #
     # Use rich markup for colors, e.g.:
     #   "[green]PASS[/green]" or "[red]FAIL[/red]"
 
-    raise NotImplementedError("TODO 8: Implement print_results()")
+    raise NotImplementedError("TODO 9: Implement print_results()")
 
 
 def save_json_report(audits: list[DeviceAudit], output_path: Path) -> None:
     """Save audit results to a JSON file."""
-    # TODO 9: Serialize audit results to JSON.
+    # TODO 10: Serialize audit results to JSON.
     #
     # Steps:
     #   1. Build a list of dicts, one per device:
@@ -292,7 +350,7 @@ def save_json_report(audits: list[DeviceAudit], output_path: Path) -> None:
     #   2. Write the list to output_path as formatted JSON (indent=2)
     #   3. Print a message confirming where the report was saved
 
-    raise NotImplementedError("TODO 9: Implement save_json_report()")
+    raise NotImplementedError("TODO 10: Implement save_json_report()")
 
 
 # ---------------------------------------------------------------------------
@@ -316,9 +374,27 @@ def parse_args() -> argparse.Namespace:
         default=Path("audit_report.json"),
         help="Path for JSON report output (default: audit_report.json)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help=f"Maximum devices audited concurrently (default: {MAX_WORKERS})",
+    )
     return parser.parse_args()
 
 
+def _has_failures(audits: list[DeviceAudit]) -> bool:
+    """Return True as soon as a device is unreachable or a check did not pass."""
+    for audit in audits:
+        if not audit.reachable:
+            return True
+        for result in audit.results:
+            # Enum members are singletons, so identity beats __eq__ dispatch
+            if result.status is not CheckStatus.PASS:
+                return True
+    return False
+
+
 def main() -> int:
     """Main entry point. Returns 0 if all checks pass, 1 otherwise."""
     args = parse_args()
@@ -332,12 +408,20 @@ def main() -> int:
 
     print(f"Auditing {len(devices)} device(s)...\n")
 
-    # Run audits
+    # Run audits concurrently -- each device is an independent SSH session,
+    # so the work is I/O-bound and overlaps well across threads.
     audits: list[DeviceAudit] = []
-    for device in devices:
-        print(f"  -> {device.hostname} ({device.ip})")
-        audit = audit_device(device)
-        audits.append(audit)
+    if devices:
+        workers: int = max(1, min(args.workers, len(devices)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(audit_device, device) for device in devices]
+            pending = dict(zip(futures, devices))
+            for future in as_completed(futures):
+                device = pending[future]
+                with PRINT_LOCK:
+                    print(f"  -> {device.hostname} ({device.ip})")
+        # Collect in inventory order, not completion order
+        audits = [future.result() for future in futures]
 
     # Display results
     print()
@@ -347,12 +431,7 @@ def main() -> int:
     save_json_report(audits, args.json_output)
 
     # Determine exit code: 1 if any check failed or any device unreachable
-    any_failures: bool = any(
-        not audit.reachable
-        or any(r.status != CheckStatus.PASS for r in audit.results)
-        for audit in audits
-    )
-    return 1 if any_failures else 0
+    return 1 if _has_failures(audits) else 0
 
 
 if __name__ == "__main__":
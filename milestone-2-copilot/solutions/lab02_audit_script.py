@@ -13,24 +13,39 @@ Usage:
 
 Dependencies:
     pip install netmiko pyyaml rich
+    pip install orjson        # optional: faster JSON report serialization
+    pip install google-re2    # optional: linear-time (DFA) config scanning
 """
 
 from __future__ import annotations
 
 import argparse
+import atexit
 import json
 import os
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Callable
 
-import yaml
 from netmiko import ConnectHandler, NetmikoAuthenticationException, NetmikoTimeoutException
-from rich.console import Console
-from rich.table import Table
+
+# yaml and rich are imported inside the functions that use them, so importing
+# this module or running --help does not pay their start-up cost.
+
+try:
+    import orjson
+except ImportError:  # optional speedup -- fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import re2 as regex_engine
+except ImportError:  # optional speedup -- fall back to the stdlib engine
+    regex_engine = re
 
 
 # ---------------------------------------------------------------------------
@@ -54,7 +69,10 @@ class CheckResult:
 
 @dataclass
 class DeviceAudit:
-    """Stores all audit results for a single device."""
+    """Stores all audit results for a single device.
+
+    results is positional: results[i] is the outcome of AUDIT_CHECKS[i].
+    """
     hostname: str
     ip: str
     results: list[CheckResult] = field(default_factory=list)
@@ -71,6 +89,62 @@ class DeviceInfo:
     device_type: str = "arista_eos"
 
 
+@dataclass
+class ParsedConfig:
+    """Audit-relevant values extracted from a device's running-config."""
+    ntp_servers: list[str] = field(default_factory=list)
+    dns_servers: list[str] = field(default_factory=list)
+    snmp_communities: list[str] = field(default_factory=list)
+    syslog_hosts: list[str] = field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Audit Constants
+# ---------------------------------------------------------------------------
+
+# Community strings that should never be used in production.
+BAD_COMMUNITIES: frozenset[str] = frozenset(
+    {"public", "private", "community", "test", "default"}
+)
+
+# Seconds to wait for "show running-config" output before giving up. This is
+# Netmiko's own send_command default; a full config from a large or busy
+# switch can take several seconds to arrive.
+CONFIG_READ_TIMEOUT: float = 10.0
+
+# Platforms that can render the running-config as JSON ("| json").
+JSON_CONFIG_PLATFORMS: frozenset[str] = frozenset({"arista_eos"})
+
+# Default upper bound on concurrent SSH sessions (override with --workers).
+MAX_WORKERS: int = 32
+
+# Serializes console output from the audit worker threads.
+PRINT_LOCK = threading.Lock()
+
+# Config line prefixes the audit collects, mapped to the position of the
+# value within the words that follow the prefix.
+CONFIG_PREFIXES: dict[str, int] = {
+    "ntp server": 0,             # "ntp server 10.100.100.100"
+    "ip name-server": -1,        # "ip name-server vrf default 8.8.8.8"
+    "snmp-server community": 0,  # "snmp-server community public ro"
+    "logging host": 0,           # "logging host 10.100.100.50"
+}
+
+# Matches every config line starting with one of CONFIG_PREFIXES. Running
+# finditer() over the whole config keeps the scan in C; only matching lines
+# ever reach Python code. With google-re2 installed the scan is a DFA that is
+# linear in the config size. The inline (?m) flag works with either engine.
+# Words within a prefix may be separated by any run of spaces or tabs, as
+# with the old split()-based parser; [ \t]+ rather than \s+ keeps a match
+# from running onto the next line.
+_PREFIX_PATTERN: str = "|".join(
+    r"[ \t]+".join(map(re.escape, prefix.split())) for prefix in CONFIG_PREFIXES
+)
+CONFIG_LINE_RE = regex_engine.compile(
+    r"(?m)^[ \t]*(" + _PREFIX_PATTERN + r")[ \t]+(\S.*?)[ \t]*$"
+)
+
+
 # ---------------------------------------------------------------------------
 # Inventory Loading
 # ---------------------------------------------------------------------------
@@ -86,10 +160,15 @@ def load_inventory(inventory_path: Path) -> list[DeviceInfo]:
             password: admin
             device_type: arista_eos
     """
+    import yaml
+
     if not inventory_path.exists():
         raise FileNotFoundError(f"Inventory file not found: {inventory_path}")
 
-    raw: dict = yaml.safe_load(inventory_path.read_text())
+    # Prefer the libyaml-backed C loader; PyYAML builds without libyaml
+    # only ship the (much slower) pure-Python SafeLoader.
+    loader: type = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    raw: dict = yaml.load(inventory_path.read_bytes(), Loader=loader)
 
     if "devices" not in raw:
         raise ValueError(f"Inventory YAML missing 'devices' key: {inventory_path}")
@@ -121,41 +200,132 @@ def connect_to_device(device: DeviceInfo) -> ConnectHandler | None:
 
     Returns a ConnectHandler on success, None on failure.
     """
-    conn_params: dict[str, str | int] = {
+    conn_params: dict[str, str | int | bool] = {
         "device_type": device.device_type,
         "host": device.ip,
         "username": device.username,
         "password": device.password,
         "timeout": 10,
+        "conn_timeout": 5,
+        "auth_timeout": 5,
+        "banner_timeout": 5,
     }
 
     try:
         connection: ConnectHandler = ConnectHandler(**conn_params)
         return connection
     except NetmikoTimeoutException:
-        print(f"    [WARN] Timeout connecting to {device.hostname} ({device.ip})")
+        with PRINT_LOCK:
+            print(f"    [WARN] Timeout connecting to {device.hostname} ({device.ip})")
         return None
     except NetmikoAuthenticationException:
-        print(f"    [WARN] Auth failed for {device.hostname} ({device.ip})")
+        with PRINT_LOCK:
+            print(f"    [WARN] Auth failed for {device.hostname} ({device.ip})")
         return None
 
 
+# Open SSH sessions kept between audits, keyed by (ip, username). Repeated
+# audits from a long-running process skip key exchange, auth, and prompt
+# detection -- the bulk of the per-device cost.
+_CONN_POOL: dict[tuple[str, str], ConnectHandler] = {}
+_CONN_POOL_LOCK = threading.Lock()
+
+
+def _close_quietly(connection: ConnectHandler) -> None:
+    """Disconnect, ignoring errors from sessions that are already dead."""
+    try:
+        connection.disconnect()
+    except Exception:
+        pass
+
+
+def _get_connection(device: DeviceInfo) -> ConnectHandler | None:
+    """Return a pooled session for the device, or open a new one."""
+    key: tuple[str, str] = (device.ip, device.username)
+    with _CONN_POOL_LOCK:
+        connection: ConnectHandler | None = _CONN_POOL.pop(key, None)
+
+    if connection is not None:
+        if connection.is_alive():
+            return connection
+        _close_quietly(connection)
+
+    return connect_to_device(device)
+
+
+def _return_connection(device: DeviceInfo, connection: ConnectHandler) -> None:
+    """Hand a session back to the pool, or close it if it has gone stale."""
+    if not connection.is_alive():
+        _close_quietly(connection)
+        return
+
+    key: tuple[str, str] = (device.ip, device.username)
+    with _CONN_POOL_LOCK:
+        pooled: ConnectHandler = _CONN_POOL.setdefault(key, connection)
+    if pooled is not connection:
+        # Another audit already returned a session for this device
+        _close_quietly(connection)
+
+
+@atexit.register
+def _close_pooled_connections() -> None:
+    """Disconnect every pooled session when the interpreter exits."""
+    with _CONN_POOL_LOCK:
+        connections: list[ConnectHandler] = list(_CONN_POOL.values())
+        _CONN_POOL.clear()
+    for connection in connections:
+        _close_quietly(connection)
+
+
+# ---------------------------------------------------------------------------
+# Config Parsing
+# ---------------------------------------------------------------------------
+
+def fetch_running_config(connection: ConnectHandler, device_type: str) -> str:
+    """Return the device's top-level config commands, one per line.
+
+    On platforms with JSON output the CLI renders the config as a nested
+    "cmds" dict, so the top-level commands come straight from json.loads()
+    with no banners, prompts, or indented sub-mode lines to screen-scrape.
+    Anything else (or a device that answers "| json" with plain text) uses
+    the regular text config.
+    """
+    if device_type in JSON_CONFIG_PLATFORMS:
+        output: str = connection.send_command(
+            "show running-config | json", read_timeout=CONFIG_READ_TIMEOUT
+        )
+        try:
+            # {"cmds": {"ntp server 10.100.100.100": null, "interface Ethernet1": {...}}}
+            return "\n".join(json.loads(output)["cmds"])
+        except (ValueError, KeyError, TypeError):
+            pass
+
+    return connection.send_command("show running-config", read_timeout=CONFIG_READ_TIMEOUT)
+
+
+def parse_running_config(config: str) -> ParsedConfig:
+    """Extract NTP, DNS, SNMP, and syslog settings in a single pass."""
+    buckets: dict[str, list[str]] = {prefix: [] for prefix in CONFIG_PREFIXES}
+    for match in CONFIG_LINE_RE.finditer(config):
+        matched_prefix, args = match.groups()
+        prefix = " ".join(matched_prefix.split())  # collapse extra whitespace
+        buckets[prefix].append(args.split()[CONFIG_PREFIXES[prefix]])
+
+    return ParsedConfig(
+        ntp_servers=buckets["ntp server"],
+        dns_servers=buckets["ip name-server"],
+        snmp_communities=buckets["snmp-server community"],
+        syslog_hosts=buckets["logging host"],
+    )
+
+
 # ---------------------------------------------------------------------------
 # Audit Check Functions
 # ---------------------------------------------------------------------------
 
-def check_ntp(connection: ConnectHandler) -> CheckResult:
+def check_ntp(config: ParsedConfig) -> CheckResult:
     """Check that at least one NTP server is configured."""
-    output: str = connection.send_command("show running-config section ntp")
-
-    servers: list[str] = []
-    for line in output.splitlines():
-        line = line.strip()
-        if line.startswith("ntp server"):
-            # "ntp server 10.100.100.100" -> extract the IP/hostname
-            parts: list[str] = line.split()
-            if len(parts) >= 3:
-                servers.append(parts[2])
+    servers: list[str] = config.ntp_servers
 
     if servers:
         return CheckResult(
@@ -170,18 +340,9 @@ def check_ntp(connection: ConnectHandler) -> CheckResult:
     )
 
 
-def check_dns(connection: ConnectHandler) -> CheckResult:
+def check_dns(config: ParsedConfig) -> CheckResult:
     """Check that at least one DNS name-server is configured."""
-    output: str = connection.send_command("show running-config section name-server")
-
-    servers: list[str] = []
-    for line in output.splitlines():
-        line = line.strip()
-        if "ip name-server" in line:
-            # "ip name-server vrf default 8.8.8.8" or "ip name-server 8.8.8.8"
-            parts: list[str] = line.split()
-            # The IP is always the last element
-            servers.append(parts[-1])
+    servers: list[str] = config.dns_servers
 
     if servers:
         return CheckResult(
@@ -196,26 +357,11 @@ def check_dns(connection: ConnectHandler) -> CheckResult:
     )
 
 
-def check_snmp(connection: ConnectHandler) -> CheckResult:
+def check_snmp(config: ParsedConfig) -> CheckResult:
     """Check that no default/weak SNMP community strings are in use."""
-    bad_communities: set[str] = {"public", "private", "community", "test", "default"}
-
-    output: str = connection.send_command("show running-config section snmp")
-
-    found_communities: list[str] = []
-    flagged: list[str] = []
-
-    for line in output.splitlines():
-        line = line.strip()
-        # Match "snmp-server community <string> ..."
-        match: re.Match[str] | None = re.match(
-            r"snmp-server\s+community\s+(\S+)", line
-        )
-        if match:
-            community: str = match.group(1)
-            found_communities.append(community)
-            if community.lower() in bad_communities:
-                flagged.append(community)
+    found_communities: list[str] = config.snmp_communities
+    bad: set[str] = {c.lower() for c in found_communities} & BAD_COMMUNITIES
+    flagged: list[str] = [c for c in found_communities if c.lower() in bad]
 
     if not found_communities:
         return CheckResult(
@@ -238,17 +384,9 @@ def check_snmp(connection: ConnectHandler) -> CheckResult:
     )
 
 
-def check_syslog(connection: ConnectHandler) -> CheckResult:
+def check_syslog(config: ParsedConfig) -> CheckResult:
     """Check that at least one syslog (logging) host is configured."""
-    output: str = connection.send_command("show running-config section logging")
-
-    hosts: list[str] = []
-    for line in output.splitlines():
-        line = line.strip()
-        if line.startswith("logging host"):
-            parts: list[str] = line.split()
-            if len(parts) >= 3:
-                hosts.append(parts[2])
+    hosts: list[str] = config.syslog_hosts
 
     if hosts:
         return CheckResult(
@@ -267,38 +405,55 @@ def check_syslog(connection: ConnectHandler) -> CheckResult:
 # Audit Orchestration
 # ---------------------------------------------------------------------------
 
-AUDIT_CHECKS: list[Callable[[ConnectHandler], CheckResult]] = [
-    check_ntp,
-    check_dns,
-    check_snmp,
-    check_syslog,
+# (name, check) pairs, in table-column order. Each check receives the
+# device's running-config, fetched and parsed once, so a device costs one
+# "show running-config" round-trip instead of four.
+AUDIT_CHECKS: list[tuple[str, Callable[[ParsedConfig], CheckResult]]] = [
+    ("NTP", check_ntp),
+    ("DNS", check_dns),
+    ("SNMP", check_snmp),
+    ("Syslog", check_syslog),
 ]
 
+CHECK_NAMES: list[str] = [name for name, _ in AUDIT_CHECKS]
+
 
 def audit_device(device: DeviceInfo) -> DeviceAudit:
     """Run all audit checks against a single device."""
     audit = DeviceAudit(hostname=device.hostname, ip=device.ip)
 
-    connection: ConnectHandler | None = connect_to_device(device)
+    connection: ConnectHandler | None = _get_connection(device)
     if connection is None:
         audit.reachable = False
         return audit
 
     try:
-        for check_fn in AUDIT_CHECKS:
+        try:
+            config: ParsedConfig = parse_running_config(
+                fetch_running_config(connection, device.device_type)
+            )
+        except Exception as exc:
+            # Without the config no check can run -- report each one as ERROR
+            audit.results = [
+                CheckResult(check_name=name, status=CheckStatus.ERROR, detail=str(exc))
+                for name in CHECK_NAMES
+            ]
+            return audit
+
+        for name, check_fn in AUDIT_CHECKS:
             try:
-                result: CheckResult = check_fn(connection)
+                result: CheckResult = check_fn(config)
                 audit.results.append(result)
             except Exception as exc:
                 audit.results.append(
                     CheckResult(
-                        check_name=check_fn.__name__.replace("check_", "").upper(),
+                        check_name=name,
                         status=CheckStatus.ERROR,
                         detail=str(exc),
                     )
                 )
     finally:
-        connection.disconnect()
+        _return_connection(device, connection)
 
     return audit
 
@@ -307,71 +462,86 @@ def audit_device(device: DeviceInfo) -> DeviceAudit:
 # Output / Reporting
 # ---------------------------------------------------------------------------
 
-def _status_markup(status: CheckStatus) -> str:
-    """Return a rich-markup string for a check status."""
-    color_map: dict[CheckStatus, str] = {
+# Rich-markup cell text for each check status, built once at import
+_STATUS_MARKUP: dict[CheckStatus, str] = {
+    status: f"[{color}]{status.value}[/{color}]"
+    for status, color in {
         CheckStatus.PASS: "green",
         CheckStatus.FAIL: "red",
         CheckStatus.ERROR: "yellow",
-    }
-    color: str = color_map.get(status, "white")
-    return f"[{color}]{status.value}[/{color}]"
+    }.items()
+}
 
 
 def print_results(audits: list[DeviceAudit]) -> None:
     """Print a summary table of all audit results using rich."""
+    from rich.console import Console
+    from rich.table import Table
+
     console = Console()
     table = Table(title="Device Audit Results", show_lines=True)
 
-    # Build column list from the check names
-    check_names: list[str] = [fn.__name__.replace("check_", "").upper() for fn in AUDIT_CHECKS]
-
     table.add_column("Device", style="bold cyan", no_wrap=True)
-    for name in check_names:
+    for name in CHECK_NAMES:
         table.add_column(name, justify="center")
 
+    unreachable: list[str] = ["[yellow]UNREACHABLE[/yellow]"] * len(CHECK_NAMES)
+
     for audit in audits:
         label: str = f"{audit.hostname}\n({audit.ip})"
 
         if not audit.reachable:
-            table.add_row(label, *["[yellow]UNREACHABLE[/yellow]"] * len(check_names))
+            table.add_row(label, *unreachable)
             continue
 
-        # Build a lookup from check_name -> CheckResult
-        result_map: dict[str, CheckResult] = {r.check_name: r for r in audit.results}
-
-        cells: list[str] = []
-        for name in check_names:
-            result: CheckResult | None = result_map.get(name)
-            if result is None:
-                cells.append("[yellow]SKIPPED[/yellow]")
-            else:
-                cells.append(_status_markup(result.status))
-
-        table.add_row(label, *cells)
+        # Results are positional: audit.results[i] belongs to CHECK_NAMES[i]
+        table.add_row(label, *[_STATUS_MARKUP[result.status] for result in audit.results])
 
     console.print(table)
 
 
-def save_json_report(audits: list[DeviceAudit], output_path: Path) -> None:
-    """Save audit results to a JSON file."""
-    report: list[dict] = []
-
-    for audit in audits:
-        device_entry: dict = {
-            "hostname": audit.hostname,
-            "ip": audit.ip,
-            "reachable": audit.reachable,
-            "checks": {},
-        }
-        for result in audit.results:
-            device_entry["checks"][result.check_name] = {
+def _report_entry(audit: DeviceAudit) -> dict:
+    """Build the JSON report entry for one device."""
+    return {
+        "hostname": audit.hostname,
+        "ip": audit.ip,
+        "reachable": audit.reachable,
+        "checks": {
+            result.check_name: {
                 "status": result.status.value,
                 "detail": result.detail,
             }
-        report.append(device_entry)
+            for result in audit.results
+        },
+    }
+
+
+def _encode_entry(entry: dict) -> bytes:
+    """Serialize one report entry as indented UTF-8 JSON, using orjson if present.
+
+    orjson never escapes non-ASCII text, so the stdlib fallback runs with
+    ensure_ascii=False to write the same bytes either way.
+    """
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_INDENT_2)
+    return json.dumps(entry, indent=2, ensure_ascii=False).encode()
+
+
+def save_json_report(audits: list[DeviceAudit], output_path: Path) -> None:
+    """Save audit results to a JSON file.
+
+    Entries are encoded and written one device at a time, so the full report
+    is never held in memory as a single list or string. The file layout is
+    the same as json.dumps(report, indent=2, ensure_ascii=False), i.e.
+    non-ASCII characters are written as UTF-8 rather than \\uXXXX escapes.
+    """
+    with output_path.open("wb") as report_file:
+        report_file.write(b"[")
+        for index, audit in enumerate(audits):
+            report_file.write(b",\n  " if index else b"\n  ")
+            report_file.write(_encode_entry(_report_entry(audit)).replace(b"\n", b"\n  "))
+        report_file.write(b"\n]\n" if audits else b"]\n")
 
-    output_path.write_text(json.dumps(report, indent=2) + "\n")
     print(f"JSON report saved to: {output_path}")
 
 
@@ -396,9 +566,27 @@ def parse_args() -> argparse.Namespace:
         default=Path("audit_report.json"),
         help="Path for JSON report output (default: audit_report.json)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help=f"Maximum devices audited concurrently (default: {MAX_WORKERS})",
+    )
     return parser.parse_args()
 
 
+def _has_failures(audits: list[DeviceAudit]) -> bool:
+    """Return True as soon as a device is unreachable or a check did not pass."""
+    for audit in audits:
+        if not audit.reachable:
+            return True
+        for result in audit.results:
+            # Enum members are singletons, so identity beats __eq__ dispatch
+            if result.status is not CheckStatus.PASS:
+                return True
+    return False
+
+
 def main() -> int:
     """Main entry point. Returns 0 if all checks pass, 1 otherwise."""
     args = parse_args()
@@ -412,12 +600,20 @@ def main() -> int:
 
     print(f"Auditing {len(devices)} device(s)...\n")
 
-    # Run audits
+    # Run audits concurrently -- each device is an independent SSH session,
+    # so the work is I/O-bound and overlaps well across threads.
     audits: list[DeviceAudit] = []
-    for device in devices:
-        print(f"  -> {device.hostname} ({device.ip})")
-        audit = audit_device(device)
-        audits.append(audit)
+    if devices:
+        workers: int = max(1, min(args.workers, len(devices)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(audit_device, device) for device in devices]
+            pending = dict(zip(futures, devices))
+            for future in as_completed(futures):
+                device = pending[future]
+                with PRINT_LOCK:
+                    print(f"  -> {device.hostname} ({device.ip})")
+        # Collect in inventory order, not completion order
+        audits = [future.result() for future in futures]
 
     # Display results
     print()
@@ -427,12 +623,7 @@ def main() -> int:
     save_json_report(audits, args.json_output)
 
     # Determine exit code: 1 if any check failed or any device unreachable
-    any_failures: bool = any(
-        not audit.reachable
-        or any(r.status != CheckStatus.PASS for r in audit.results)
-        for audit in audits
-    )
-    return 1 if any_failures else 0
+    return 1 if _has_failures(audits) else 0
 
 
 if __name__ == "__main__":
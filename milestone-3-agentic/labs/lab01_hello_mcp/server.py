@@ -8,18 +8,32 @@ and docstrings, and the SDK handles the rest.
 Run:
     uv run server.py
 
+    Set MCP_PRETTY_JSON=1 to indent tool output (compact by default).
+
 Test with MCP Inspector:
     npx @modelcontextprotocol/inspector uv run server.py
 """
 
-import json
+import os
+from typing import Any
 
+import orjson
 from pydantic import BaseModel, Field
 
 from mcp.server.fastmcp import FastMCP
 
 mcp = FastMCP("hello-network")
 
+# Tool output is read by an LLM, so compact JSON by default saves tokens.
+# Set MCP_PRETTY_JSON=1 to indent it for reading in the MCP Inspector.
+_JSON_OPTION = orjson.OPT_INDENT_2 if os.environ.get("MCP_PRETTY_JSON") == "1" else 0
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response to JSON with orjson."""
+    return orjson.dumps(obj, option=_JSON_OPTION).decode()
+
+
 # ---------------------------------------------------------------------------
 # Mock data -- in a real server, this would come from NAPALM, Netmiko, or an API.
 # ---------------------------------------------------------------------------
@@ -119,6 +133,26 @@ INTERFACES: dict[str, dict[str, dict]] = {
 }
 
 
+# The mock data never changes after import, so serialize every possible tool
+# response once here. Each tool call is then a dict lookup, not a serialization.
+_DEVICE_JSON: dict[str, str] = {
+    hostname: _dumps(device) for hostname, device in DEVICES.items()
+}
+
+_INTERFACE_JSON: dict[tuple[str, str], str] = {
+    (hostname, interface): _dumps({"hostname": hostname, "interface": interface, **data})
+    for hostname, interfaces in INTERFACES.items()
+    for interface, data in interfaces.items()
+}
+
+# Error-path listings, also fixed at import
+_AVAILABLE_DEVICES: str = ", ".join(sorted(DEVICES))
+_AVAILABLE_INTERFACE_DEVICES: str = ", ".join(sorted(INTERFACES))
+_AVAILABLE_INTERFACES: dict[str, str] = {
+    hostname: ", ".join(sorted(interfaces)) for hostname, interfaces in INTERFACES.items()
+}
+
+
 # ---------------------------------------------------------------------------
 # Pydantic models for tool inputs
 # ---------------------------------------------------------------------------
@@ -156,14 +190,13 @@ async def get_device_info(hostname: str) -> str:
     site location, role, and uptime. Use this when asked about a specific
     device's details or inventory information.
     """
-    if hostname not in DEVICES:
-        available = ", ".join(sorted(DEVICES.keys()))
+    if hostname not in _DEVICE_JSON:
         raise ValueError(
             f"Device '{hostname}' not found in inventory. "
-            f"Available devices: {available}"
+            f"Available devices: {_AVAILABLE_DEVICES}"
         )
 
-    return json.dumps(DEVICES[hostname], indent=2)
+    return _DEVICE_JSON[hostname]
 
 
 @mcp.tool()
@@ -175,22 +208,19 @@ async def get_interface_status(hostname: str, interface: str) -> str:
     or port configuration.
     """
     if hostname not in INTERFACES:
-        available = ", ".join(sorted(INTERFACES.keys()))
         raise ValueError(
-            f"Device '{hostname}' not found. Available devices: {available}"
+            f"Device '{hostname}' not found. "
+            f"Available devices: {_AVAILABLE_INTERFACE_DEVICES}"
         )
 
-    device_interfaces = INTERFACES[hostname]
-    if interface not in device_interfaces:
-        available = ", ".join(sorted(device_interfaces.keys()))
+    key = (hostname, interface)
+    if key not in _INTERFACE_JSON:
         raise ValueError(
             f"Interface '{interface}' not found on {hostname}. "
-            f"Available interfaces: {available}"
+            f"Available interfaces: {_AVAILABLE_INTERFACES[hostname]}"
         )
 
-    result = {"hostname": hostname, "interface": interface}
-    result.update(device_interfaces[interface])
-    return json.dumps(result, indent=2)
+    return _INTERFACE_JSON[key]
 
 
 # ---------------------------------------------------------------------------
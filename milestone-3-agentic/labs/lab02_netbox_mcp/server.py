@@ -5,8 +5,11 @@ This server exposes read-only tools for querying NetBox device inventory
 and IPAM data. It uses httpx for async HTTP calls to the NetBox REST API.
 
 Configuration (environment variables):
-    NETBOX_URL   - Base URL of your NetBox instance (e.g., https://netbox.example.com)
-    NETBOX_TOKEN - API token for authentication
+    NETBOX_URL             - Base URL of your NetBox instance (e.g., https://netbox.example.com)
+    NETBOX_TOKEN           - API token for authentication
+    NETBOX_CACHE_TTL       - Seconds to cache identical GET responses (default 30, 0 disables)
+    MCP_PRETTY_JSON        - Set to 1 to indent tool output (compact by default)
+    NETBOX_MAX_CONCURRENCY - Maximum in-flight NetBox requests (default 20)
 
 Run:
     NETBOX_URL=https://netbox.example.com NETBOX_TOKEN=abc123 uv run server.py
@@ -16,15 +19,33 @@ Test with MCP Inspector:
         npx @modelcontextprotocol/inspector uv run server.py
 """
 
-import json
+import asyncio
+import ipaddress
 import os
+import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
+import orjson
+from cachetools import TTLCache
 
 from mcp.server.fastmcp import FastMCP
 
-mcp = FastMCP("netbox-mcp")
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared NetBox client when the MCP server shuts down."""
+    try:
+        yield
+    finally:
+        if _client is not None:
+            await _client.aclose()
+
+
+mcp = FastMCP("netbox-mcp", lifespan=_lifespan)
 
 # ---------------------------------------------------------------------------
 # NetBox API client
@@ -32,30 +53,68 @@ mcp = FastMCP("netbox-mcp")
 
 NETBOX_URL = os.environ.get("NETBOX_URL", "")
 NETBOX_TOKEN = os.environ.get("NETBOX_TOKEN", "")
+NETBOX_CACHE_TTL = float(os.environ.get("NETBOX_CACHE_TTL", "30"))
+NETBOX_MAX_CONCURRENCY = int(os.environ.get("NETBOX_MAX_CONCURRENCY", "20"))
+
+
+# Built once at import time; the client carries them on every request
+_HEADERS = {
+    "Authorization": f"Token {NETBOX_TOKEN}",
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+}
+_BASE_URL = NETBOX_URL.rstrip("/")
 
 
-def _get_headers() -> dict[str, str]:
-    """Build HTTP headers for NetBox API requests."""
+def _validate_config() -> None:
+    """Check the NetBox environment variables are set."""
     if not NETBOX_TOKEN:
         raise RuntimeError(
             "NETBOX_TOKEN environment variable is not set. "
             "Set it to your NetBox API token."
         )
-    return {
-        "Authorization": f"Token {NETBOX_TOKEN}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
-
-
-def _get_base_url() -> str:
-    """Get and validate the NetBox base URL."""
     if not NETBOX_URL:
         raise RuntimeError(
             "NETBOX_URL environment variable is not set. "
             "Set it to your NetBox instance URL (e.g., https://netbox.example.com)."
         )
-    return NETBOX_URL.rstrip("/")
+
+
+# One long-lived client for every tool call, so HTTP keep-alive reuses the
+# same connections instead of paying a TCP/TLS handshake per request.
+# HTTP/2 multiplexes concurrent calls over one connection; httpx advertises
+# brotli/zstd in Accept-Encoding on its own when those decoders are installed.
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared NetBox client, creating it on first use."""
+    global _client
+    if _client is None:
+        _validate_config()
+        _client = httpx.AsyncClient(
+            base_url=_BASE_URL,
+            headers=_HEADERS,
+            timeout=30.0,
+            verify=True,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _client
+
+
+# Agents often repeat the same lookup within a conversation. Every tool is
+# read-only, so a short-lived cache of GET responses is safe. No lock is
+# needed: cache reads and writes never await, so they can't interleave.
+_cache: TTLCache | None = (
+    TTLCache(maxsize=512, ttl=NETBOX_CACHE_TTL) if NETBOX_CACHE_TTL > 0 else None
+)
+
+
+# Caps in-flight requests when an agent fires many tool calls at once, so
+# bursts queue here instead of flooding NetBox into 429s. The default
+# matches the client's keep-alive pool size.
+_semaphore = asyncio.Semaphore(NETBOX_MAX_CONCURRENCY)
 
 
 async def _netbox_get(path: str, params: dict[str, Any] | None = None) -> dict:
@@ -71,24 +130,182 @@ async def _netbox_get(path: str, params: dict[str, Any] | None = None) -> dict:
     Raises:
         RuntimeError: If the request fails
     """
-    url = f"{_get_base_url()}{path}"
-
-    async with httpx.AsyncClient(timeout=30.0, verify=True) as client:
-        try:
-            response = await client.get(url, headers=_get_headers(), params=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as exc:
-            raise RuntimeError(
-                f"NetBox API error: {exc.response.status_code} - "
-                f"{exc.response.text[:500]}"
-            ) from exc
-        except httpx.ConnectError as exc:
-            raise RuntimeError(
-                f"Cannot connect to NetBox at {_get_base_url()}. "
-                f"Check NETBOX_URL is correct and the server is reachable. "
-                f"Error: {exc}"
-            ) from exc
+    # List values (repeated filters like name=a&name=b) become tuples to hash
+    key = (
+        path,
+        tuple(sorted(
+            (k, tuple(v) if isinstance(v, list) else v) for k, v in (params or {}).items()
+        )),
+    )
+    if _cache is not None and key in _cache:
+        return _cache[key]
+
+    client = _get_client()
+
+    try:
+        async with _semaphore:
+            response = await client.get(path, params=params)
+        response.raise_for_status()
+        # Parse the raw bytes directly -- skips httpx's text decode step
+        data = orjson.loads(response.content)
+    except httpx.HTTPStatusError as exc:
+        raise RuntimeError(
+            f"NetBox API error: {exc.response.status_code} - "
+            f"{exc.response.text[:500]}"
+        ) from exc
+    except httpx.ConnectError as exc:
+        raise RuntimeError(
+            f"Cannot connect to NetBox at {_BASE_URL}. "
+            f"Check NETBOX_URL is correct and the server is reachable. "
+            f"Error: {exc}"
+        ) from exc
+
+    if _cache is not None:
+        _cache[key] = data
+    return data
+
+
+# NetBox's default MAX_PAGE_SIZE -- larger limits are silently capped
+PAGE_SIZE = 1000
+
+
+async def _netbox_paginate(
+    path: str, params: dict[str, Any] | None = None, limit: int = PAGE_SIZE
+) -> AsyncIterator[dict]:
+    """Yield result pages from a NetBox list endpoint until `limit` objects are seen.
+
+    Follows the `next` link of each page over the shared client, so a large
+    limit costs one request per 1000 objects rather than failing or truncating.
+    """
+    params = {**(params or {}), "limit": min(limit, PAGE_SIZE)}
+    data = await _netbox_get(path, params=params)
+    remaining = limit
+    while True:
+        yield data
+        remaining -= len(data.get("results", ()))
+        next_url = data.get("next")
+        if remaining <= 0 or not next_url:
+            return
+        data = await _netbox_get(next_url)
+
+
+# Tool output is read by an LLM, so compact JSON by default saves tokens
+_JSON_OPTION = orjson.OPT_INDENT_2 if os.environ.get("MCP_PRETTY_JSON") == "1" else 0
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response to JSON with orjson."""
+    return orjson.dumps(obj, option=_JSON_OPTION).decode()
+
+
+def _address_counts(total: int, used: int) -> tuple[int | str, int | str]:
+    """Return (total, available) as ints, or both as strings if total is too
+    large for orjson (e.g. IPv6 sizes), so the two fields always share a type."""
+    if total < 2**64:
+        return total, total - used
+    return str(total), str(total - used)
+
+
+# NetBox device names are free-form text of at most 64 characters, so only
+# empty or over-long names can be rejected without asking NetBox.
+_MAX_HOSTNAME_LENGTH = 64
+
+
+def _is_valid_hostname(hostname: str) -> bool:
+    """Return True if hostname could be a NetBox device name."""
+    return 0 < len(hostname) <= _MAX_HOSTNAME_LENGTH
+
+
+# ---------------------------------------------------------------------------
+# Response shaping
+#
+# orjson serializes dataclasses natively, and slots=True drops the
+# per-instance __dict__, so large result lists cost less to build and dump.
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class DeviceSummary:
+    """One row of list_devices output."""
+
+    id: int
+    hostname: str
+    model: str
+    site: str
+    role: str
+    status: str
+    primary_ip: str | None
+
+
+@dataclass(slots=True)
+class IPSummary:
+    """One row of list_ip_addresses output."""
+
+    address: str
+    status: str
+    dns_name: str
+    description: str
+    assigned_to: str | None
+    tenant: str | None
+
+
+# The `(d.get(key) or {})` form only builds an empty dict when the field
+# is missing or null, rather than on every lookup. Model, site, role and
+# status repeat across many rows, so they are interned to one shared string
+# each instead of a fresh copy per parsed object.
+def _summarize_device(device: dict) -> DeviceSummary:
+    """Project a NetBox device object down to the list_devices fields."""
+    d_get = device.get
+    return DeviceSummary(
+        id=device["id"],
+        hostname=device["name"],
+        model=sys.intern((d_get("device_type") or {}).get("display") or "Unknown"),
+        site=sys.intern((d_get("site") or {}).get("name") or "Unknown"),
+        role=sys.intern((d_get("role") or {}).get("name") or "Unknown"),
+        status=sys.intern((d_get("status") or {}).get("label") or "Unknown"),
+        primary_ip=(d_get("primary_ip") or {}).get("address"),
+    )
+
+
+def _device_detail(device: dict) -> dict[str, Any]:
+    """Project a NetBox device object down to the get_device fields."""
+    d_get = device.get
+    device_type = d_get("device_type") or {}
+    return {
+        "id": device["id"],
+        "hostname": device["name"],
+        "model": device_type.get("display") or "Unknown",
+        "manufacturer": (device_type.get("manufacturer") or {}).get("name") or "Unknown",
+        "serial_number": d_get("serial", ""),
+        "asset_tag": d_get("asset_tag"),
+        "site": (d_get("site") or {}).get("name") or "Unknown",
+        "rack": (d_get("rack") or {}).get("name"),
+        "position": d_get("position"),
+        "role": (d_get("role") or {}).get("name") or "Unknown",
+        "status": (d_get("status") or {}).get("label") or "Unknown",
+        "platform": (d_get("platform") or {}).get("name"),
+        "primary_ip": (d_get("primary_ip") or {}).get("address"),
+        "comments": d_get("comments", ""),
+        "tags": [tag["name"] for tag in d_get("tags") or ()],
+    }
+
+
+def _summarize_ip(ip: dict) -> IPSummary:
+    """Project a NetBox IP address object down to the list_ip_addresses fields."""
+    ip_get = ip.get
+    obj = ip_get("assigned_object") or {}
+    device_name = (obj.get("device") or {}).get("name")
+    iface_name = obj.get("name")
+    return IPSummary(
+        address=ip["address"],
+        status=sys.intern((ip_get("status") or {}).get("label") or "Unknown"),
+        dns_name=ip_get("dns_name", ""),
+        description=ip_get("description", ""),
+        assigned_to=(
+            f"{device_name} - {iface_name}" if device_name and iface_name else None
+        ),
+        tenant=(ip_get("tenant") or {}).get("name"),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -113,36 +330,24 @@ async def list_devices(
         role: Filter by device role slug (e.g., 'core-router'). Optional.
         limit: Maximum number of results to return. Default 50.
     """
-    params: dict[str, Any] = {"limit": limit}
+    # config_context is the bulkiest part of a device object and no tool
+    # reports it. brief=1 would also drop site, role, status and primary_ip.
+    params: dict[str, Any] = {"exclude": "config_context"}
     if site:
         params["site"] = site
     if role:
         params["role"] = role
 
-    data = await _netbox_get("/api/dcim/devices/", params=params)
-
-    devices = []
-    for device in data.get("results", []):
-        primary_ip = None
-        if device.get("primary_ip"):
-            primary_ip = device["primary_ip"].get("address")
-
-        devices.append({
-            "id": device["id"],
-            "hostname": device["name"],
-            "model": device.get("device_type", {}).get("display", "Unknown"),
-            "site": device.get("site", {}).get("name", "Unknown"),
-            "role": device.get("role", {}).get("name", "Unknown"),
-            "status": device.get("status", {}).get("label", "Unknown"),
-            "primary_ip": primary_ip,
-        })
+    pages = [page async for page in _netbox_paginate("/api/dcim/devices/", params, limit)]
+    devices = [_summarize_device(d) for page in pages for d in page.get("results", ())]
+    del devices[limit:]
 
     result = {
-        "count": data.get("count", 0),
+        "count": pages[0].get("count", 0),
         "returned": len(devices),
         "devices": devices,
     }
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -156,7 +361,15 @@ async def get_device(hostname: str) -> str:
     Args:
         hostname: The exact hostname (name) of the device in NetBox.
     """
-    data = await _netbox_get("/api/dcim/devices/", params={"name": hostname})
+    if not _is_valid_hostname(hostname):
+        raise ValueError(
+            f"'{hostname}' is not a valid device hostname. "
+            f"NetBox device names are 1-{_MAX_HOSTNAME_LENGTH} characters long."
+        )
+
+    data = await _netbox_get(
+        "/api/dcim/devices/", params={"name": hostname, "exclude": "config_context"}
+    )
 
     results = data.get("results", [])
     if not results:
@@ -165,34 +378,44 @@ async def get_device(hostname: str) -> str:
             f"Check the hostname is spelled correctly."
         )
 
-    device = results[0]
+    return _dumps(_device_detail(results[0]))
 
-    primary_ip = None
-    if device.get("primary_ip"):
-        primary_ip = device["primary_ip"].get("address")
 
-    info = {
-        "id": device["id"],
-        "hostname": device["name"],
-        "model": device.get("device_type", {}).get("display", "Unknown"),
-        "manufacturer": device.get("device_type", {}).get("manufacturer", {}).get(
-            "name", "Unknown"
-        ),
-        "serial_number": device.get("serial", ""),
-        "asset_tag": device.get("asset_tag"),
-        "site": device.get("site", {}).get("name", "Unknown"),
-        "rack": device.get("rack", {}).get("name") if device.get("rack") else None,
-        "position": device.get("position"),
-        "role": device.get("role", {}).get("name", "Unknown"),
-        "status": device.get("status", {}).get("label", "Unknown"),
-        "platform": device.get("platform", {}).get("name")
-        if device.get("platform")
-        else None,
-        "primary_ip": primary_ip,
-        "comments": device.get("comments", ""),
-        "tags": [tag["name"] for tag in device.get("tags", [])],
+@mcp.tool()
+async def get_devices(hostnames: list[str]) -> str:
+    """Get detailed information about several devices from NetBox at once.
+
+    Returns the same details as get_device for every hostname, in a single
+    NetBox request. Use this instead of calling get_device repeatedly when
+    asked about more than one device.
+
+    Args:
+        hostnames: Exact hostnames (names) of the devices in NetBox.
+    """
+    names = list(dict.fromkeys(hostnames))  # de-duplicate, keep order
+    if not names:
+        # An empty name filter would make NetBox return every device
+        raise ValueError("Provide at least one hostname.")
+    invalid = [name for name in names if not _is_valid_hostname(name)]
+    if invalid:
+        raise ValueError(
+            f"Not valid device hostnames: {', '.join(map(repr, invalid))}. "
+            f"NetBox device names are 1-{_MAX_HOSTNAME_LENGTH} characters long."
+        )
+
+    # NetBox ORs repeated filter values: ?name=a&name=b matches either device
+    params = {"name": names, "exclude": "config_context"}
+    found = {
+        device["name"]: _device_detail(device)
+        async for page in _netbox_paginate("/api/dcim/devices/", params, len(names))
+        for device in page.get("results", ())
     }
-    return json.dumps(info, indent=2)
+
+    result = {
+        "devices": found,
+        "not_found": [name for name in names if name not in found],
+    }
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -208,37 +431,22 @@ async def list_ip_addresses(prefix: str | None = None, limit: int = 50) -> str:
                 Optional -- returns all IPs if not specified.
         limit: Maximum number of results. Default 50.
     """
-    params: dict[str, Any] = {"limit": limit}
+    params: dict[str, Any] = {}
     if prefix:
         params["parent"] = prefix
 
-    data = await _netbox_get("/api/ipam/ip-addresses/", params=params)
-
-    addresses = []
-    for ip in data.get("results", []):
-        assigned_to = None
-        if ip.get("assigned_object"):
-            obj = ip["assigned_object"]
-            device_name = obj.get("device", {}).get("name", "")
-            iface_name = obj.get("name", "")
-            if device_name and iface_name:
-                assigned_to = f"{device_name} - {iface_name}"
-
-        addresses.append({
-            "address": ip["address"],
-            "status": ip.get("status", {}).get("label", "Unknown"),
-            "dns_name": ip.get("dns_name", ""),
-            "description": ip.get("description", ""),
-            "assigned_to": assigned_to,
-            "tenant": ip.get("tenant", {}).get("name") if ip.get("tenant") else None,
-        })
+    pages = [
+        page async for page in _netbox_paginate("/api/ipam/ip-addresses/", params, limit)
+    ]
+    addresses = [_summarize_ip(ip) for page in pages for ip in page.get("results", ())]
+    del addresses[limit:]
 
     result = {
-        "count": data.get("count", 0),
+        "count": pages[0].get("count", 0),
         "returned": len(addresses),
         "addresses": addresses,
     }
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -252,7 +460,25 @@ async def get_prefix_utilization(prefix: str) -> str:
     Args:
         prefix: The prefix in CIDR notation (e.g., '10.0.0.0/24').
     """
-    data = await _netbox_get("/api/ipam/prefixes/", params={"prefix": prefix})
+    # Require an explicit prefix length and no host bits, so what is
+    # validated here is exactly what NetBox is asked for
+    try:
+        if "/" not in prefix:
+            raise ValueError("missing prefix length")
+        net = ipaddress.ip_network(prefix)
+    except ValueError as exc:
+        raise ValueError(
+            f"'{prefix}' is not a valid prefix ({exc}). "
+            f"Use CIDR notation with the network address (e.g., '10.0.0.0/24')."
+        ) from exc
+    cidr = str(net)
+
+    # Look up the prefix and count its child IPs concurrently -- the count
+    # only needs the CIDR string, not the prefix object
+    data, child_ips = await asyncio.gather(
+        _netbox_get("/api/ipam/prefixes/", params={"prefix": cidr}),
+        _netbox_get("/api/ipam/ip-addresses/", params={"parent": cidr, "limit": 1}),
+    )
 
     results = data.get("results", [])
     if not results:
@@ -262,23 +488,12 @@ async def get_prefix_utilization(prefix: str) -> str:
         )
 
     pfx = results[0]
-    prefix_id = pfx["id"]
-
-    # Fetch the available IPs count from the prefix detail
-    detail = await _netbox_get(f"/api/ipam/prefixes/{prefix_id}/available-ips/")
-
-    # Calculate utilization from child IP count
-    child_ips = await _netbox_get(
-        "/api/ipam/ip-addresses/", params={"parent": prefix, "limit": 1}
-    )
     total_ips_used = child_ips.get("count", 0)
 
-    # Parse CIDR to estimate total size
-    cidr = int(prefix.split("/")[1])
-    if cidr <= 30:
-        total_addresses = (2 ** (32 - cidr)) - 2  # subtract network + broadcast
-    else:
-        total_addresses = 2 ** (32 - cidr)
+    # IPv4 subnets larger than a /31 lose the network and broadcast addresses
+    total_addresses = net.num_addresses
+    if net.version == 4 and net.prefixlen <= 30:
+        total_addresses -= 2
 
     utilization_pct = (
         round((total_ips_used / total_addresses) * 100, 1)
@@ -286,6 +501,7 @@ async def get_prefix_utilization(prefix: str) -> str:
         else 0
     )
 
+    total_json, available_json = _address_counts(total_addresses, total_ips_used)
     info = {
         "prefix": pfx["prefix"],
         "description": pfx.get("description", ""),
@@ -293,12 +509,12 @@ async def get_prefix_utilization(prefix: str) -> str:
         "vlan": pfx.get("vlan", {}).get("display") if pfx.get("vlan") else None,
         "status": pfx.get("status", {}).get("label", "Unknown"),
         "tenant": pfx.get("tenant", {}).get("name") if pfx.get("tenant") else None,
-        "total_addresses": total_addresses,
+        "total_addresses": total_json,
         "ips_assigned": total_ips_used,
         "utilization_percent": utilization_pct,
-        "available": total_addresses - total_ips_used,
+        "available": available_json,
     }
-    return json.dumps(info, indent=2)
+    return _dumps(info)
 
 
 # ---------------------------------------------------------------------------
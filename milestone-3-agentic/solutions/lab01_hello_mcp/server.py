@@ -10,6 +10,8 @@ Tools:
 Run:
     uv run server.py
 
+    Set MCP_PRETTY_JSON=1 to indent tool output (compact by default).
+
 Test with MCP Inspector:
     npx @modelcontextprotocol/inspector uv run server.py
 
@@ -24,14 +26,26 @@ Connect to Claude Desktop (add to claude_desktop_config.json):
     }
 """
 
-import json
+import os
+from typing import Any
 
+import orjson
 from pydantic import BaseModel, Field
 
 from mcp.server.fastmcp import FastMCP
 
 mcp = FastMCP("hello-network")
 
+# Tool output is read by an LLM, so compact JSON by default saves tokens.
+# Set MCP_PRETTY_JSON=1 to indent it for reading in the MCP Inspector.
+_JSON_OPTION = orjson.OPT_INDENT_2 if os.environ.get("MCP_PRETTY_JSON") == "1" else 0
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response to JSON with orjson."""
+    return orjson.dumps(obj, option=_JSON_OPTION).decode()
+
+
 # ---------------------------------------------------------------------------
 # Mock data
 #
@@ -154,6 +168,26 @@ INTERFACES: dict[str, dict[str, dict]] = {
 }
 
 
+# The mock data never changes after import, so serialize every possible tool
+# response once here. Each tool call is then a dict lookup, not a serialization.
+_DEVICE_JSON: dict[str, str] = {
+    hostname: _dumps(device) for hostname, device in DEVICES.items()
+}
+
+_INTERFACE_JSON: dict[tuple[str, str], str] = {
+    (hostname, interface): _dumps({"hostname": hostname, "interface": interface, **data})
+    for hostname, interfaces in INTERFACES.items()
+    for interface, data in interfaces.items()
+}
+
+# Error-path listings, also fixed at import
+_AVAILABLE_DEVICES: str = ", ".join(sorted(DEVICES))
+_AVAILABLE_INTERFACE_DEVICES: str = ", ".join(sorted(INTERFACES))
+_AVAILABLE_INTERFACES: dict[str, str] = {
+    hostname: ", ".join(sorted(interfaces)) for hostname, interfaces in INTERFACES.items()
+}
+
+
 # ---------------------------------------------------------------------------
 # Pydantic models
 # ---------------------------------------------------------------------------
@@ -196,14 +230,13 @@ async def get_device_info(hostname: str) -> str:
     - "What is the management IP of switch-access-01?"
     - "How long has switch-access-02 been up?"
     """
-    if hostname not in DEVICES:
-        available = ", ".join(sorted(DEVICES.keys()))
+    if hostname not in _DEVICE_JSON:
         raise ValueError(
             f"Device '{hostname}' not found in inventory. "
-            f"Available devices: {available}"
+            f"Available devices: {_AVAILABLE_DEVICES}"
         )
 
-    return json.dumps(DEVICES[hostname], indent=2)
+    return _DEVICE_JSON[hostname]
 
 
 @mcp.tool()
@@ -220,22 +253,19 @@ async def get_interface_status(hostname: str, interface: str) -> str:
     - "What speed is the uplink running at?"
     """
     if hostname not in INTERFACES:
-        available = ", ".join(sorted(INTERFACES.keys()))
         raise ValueError(
-            f"Device '{hostname}' not found. Available devices: {available}"
+            f"Device '{hostname}' not found. "
+            f"Available devices: {_AVAILABLE_INTERFACE_DEVICES}"
         )
 
-    device_interfaces = INTERFACES[hostname]
-    if interface not in device_interfaces:
-        available = ", ".join(sorted(device_interfaces.keys()))
+    key = (hostname, interface)
+    if key not in _INTERFACE_JSON:
         raise ValueError(
             f"Interface '{interface}' not found on {hostname}. "
-            f"Available interfaces: {available}"
+            f"Available interfaces: {_AVAILABLE_INTERFACES[hostname]}"
         )
 
-    result = {"hostname": hostname, "interface": interface}
-    result.update(device_interfaces[interface])
-    return json.dumps(result, indent=2)
+    return _INTERFACE_JSON[key]
 
 
 # ---------------------------------------------------------------------------
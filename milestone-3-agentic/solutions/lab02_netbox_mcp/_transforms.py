@@ -0,0 +1,121 @@
+"""
+Record transforms for the NetBox MCP server.
+
+Pure functions that project raw NetBox API objects down to the fields each
+tool returns. They live in their own strictly typed module so the hot
+per-record code can optionally be compiled to a C extension with mypyc:
+
+    uv run --with mypy mypyc _transforms.py
+
+Python imports the compiled extension in preference to this file when both
+are present; delete the generated .so/.pyd to go back to pure Python.
+server.py imports from here either way.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+
+def safe_nested(obj: dict[str, Any] | None, *keys: str, default: Any = None) -> Any:
+    """Safely traverse nested dicts. Returns default if any key is missing."""
+    current: Any = obj
+    for key in keys:
+        if not isinstance(current, dict):
+            return default
+        current = current.get(key)
+        if current is None:
+            return default
+    return current
+
+
+def nested_getter(*keys: str, default: Any = None) -> Callable[[dict[str, Any]], Any]:
+    """Build a getter equivalent to safe_nested(obj, *keys, default=default).
+
+    The keys are bound once, so calling the getter in a per-record loop skips
+    re-packing the key tuple on every call.
+    """
+    first, *rest = keys
+
+    def get(obj: dict[str, Any]) -> Any:
+        current: Any = obj.get(first)
+        for key in rest:
+            if not isinstance(current, dict):
+                return default
+            current = current.get(key)
+        return default if current is None else current
+
+    return get
+
+
+# Accessors for the list_devices / list_ip_addresses per-record loops
+_get_model = nested_getter("device_type", "display", default="Unknown")
+_get_site = nested_getter("site", "name", default="Unknown")
+_get_role = nested_getter("role", "name", default="Unknown")
+_get_status = nested_getter("status", "label", default="Unknown")
+_get_primary_ip = nested_getter("primary_ip", "address")
+_get_device_name = nested_getter("device", "name", default="")
+_get_tenant = nested_getter("tenant", "name")
+_get_vrf = nested_getter("vrf", "name")
+
+
+def format_assigned(ip: dict[str, Any]) -> str | None:
+    """Describe what an IP is assigned to: 'device - interface', or None."""
+    assigned_obj = ip.get("assigned_object")
+    if not assigned_obj:
+        return None
+    device_name = _get_device_name(assigned_obj)
+    iface_name = assigned_obj.get("name", "")
+    return (
+        f"{device_name} - {iface_name}" if device_name and iface_name
+        else device_name or None
+    )
+
+
+def device_summary(device: dict[str, Any]) -> dict[str, Any]:
+    """Build the list_devices view of a NetBox device object."""
+    return {
+        "id": device["id"],
+        "hostname": device["name"],
+        "model": _get_model(device),
+        "site": _get_site(device),
+        "role": _get_role(device),
+        "status": _get_status(device),
+        "primary_ip": _get_primary_ip(device),
+    }
+
+
+def ip_summary(ip: dict[str, Any]) -> dict[str, Any]:
+    """Build the list_ip_addresses view of a NetBox IP address object."""
+    return {
+        "address": ip["address"],
+        "status": _get_status(ip),
+        "dns_name": ip.get("dns_name", ""),
+        "description": ip.get("description", ""),
+        "assigned_to": format_assigned(ip),
+        "tenant": _get_tenant(ip),
+        "vrf": _get_vrf(ip),
+    }
+
+
+def device_detail(device: dict[str, Any]) -> dict[str, Any]:
+    """Build the get_device view of a NetBox device object."""
+    return {
+        "id": device["id"],
+        "hostname": device["name"],
+        "model": safe_nested(device, "device_type", "display", default="Unknown"),
+        "manufacturer": safe_nested(
+            device, "device_type", "manufacturer", "name", default="Unknown"
+        ),
+        "serial_number": device.get("serial", ""),
+        "asset_tag": device.get("asset_tag"),
+        "site": safe_nested(device, "site", "name", default="Unknown"),
+        "rack": safe_nested(device, "rack", "name"),
+        "position": device.get("position"),
+        "role": safe_nested(device, "role", "name", default="Unknown"),
+        "status": safe_nested(device, "status", "label", default="Unknown"),
+        "platform": safe_nested(device, "platform", "name"),
+        "primary_ip": safe_nested(device, "primary_ip", "address"),
+        "comments": device.get("comments", ""),
+        "tags": [tag["name"] for tag in device.get("tags", [])],
+        "url": device.get("url", ""),
+    }
@@ -7,12 +7,15 @@ tools for device inventory and IPAM queries.
 Tools:
     list_devices          - List devices with optional site/role filters
     get_device            - Get full details for a specific device by hostname
+    get_devices           - Get full details for several devices at once
     list_ip_addresses     - List IP addresses, optionally filtered by prefix
     get_prefix_utilization - Get utilization stats for a specific prefix
 
 Configuration (environment variables):
-    NETBOX_URL   - Base URL of your NetBox instance (e.g., https://netbox.example.com)
-    NETBOX_TOKEN - API token for authentication
+    NETBOX_URL       - Base URL of your NetBox instance (e.g., https://netbox.example.com)
+    NETBOX_TOKEN     - API token for authentication
+    NETBOX_CACHE_TTL - Seconds to cache identical GET responses (default 30, 0 disables)
+    MCP_PRETTY_JSON  - Set to 1 to indent tool output (compact by default)
 
 Run:
     NETBOX_URL=https://netbox.example.com NETBOX_TOKEN=abc123 uv run server.py
@@ -36,15 +39,33 @@ Connect to Claude Desktop (add to claude_desktop_config.json):
     }
 """
 
-import json
+import asyncio
+import ipaddress
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
 
 from mcp.server.fastmcp import FastMCP
 
-mcp = FastMCP("netbox-mcp")
+from _transforms import device_detail, device_summary, ip_summary, safe_nested
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared NetBox client when the MCP server shuts down."""
+    try:
+        yield
+    finally:
+        if _CLIENT is not None:
+            await _CLIENT.aclose()
+
+
+mcp = FastMCP("netbox-mcp", lifespan=_lifespan)
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -52,35 +73,80 @@ mcp = FastMCP("netbox-mcp")
 
 NETBOX_URL = os.environ.get("NETBOX_URL", "")
 NETBOX_TOKEN = os.environ.get("NETBOX_TOKEN", "")
+NETBOX_CACHE_TTL = float(os.environ.get("NETBOX_CACHE_TTL", "30"))
 
+# Tool output is read by an LLM, which has no use for indentation; it only
+# adds bytes and tokens. Set MCP_PRETTY_JSON=1 to read it in the Inspector.
+MCP_PRETTY_JSON = os.environ.get("MCP_PRETTY_JSON") == "1"
+_JSON_OPTION = orjson.OPT_INDENT_2 if MCP_PRETTY_JSON else 0
 
-# ---------------------------------------------------------------------------
-# NetBox API client
-# ---------------------------------------------------------------------------
+# Built once at import; the shared client sends them with every request
+_HEADERS = {
+    "Authorization": f"Token {NETBOX_TOKEN}",
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+}
+_BASE_URL = NETBOX_URL.rstrip("/")
 
 
-def _get_headers() -> dict[str, str]:
-    """Build HTTP headers for NetBox API requests."""
+def _validate_env() -> None:
+    """Raise if NETBOX_URL or NETBOX_TOKEN is missing."""
     if not NETBOX_TOKEN:
         raise RuntimeError(
             "NETBOX_TOKEN environment variable is not set. "
             "Export it before running: export NETBOX_TOKEN='your-token'"
         )
-    return {
-        "Authorization": f"Token {NETBOX_TOKEN}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
-
-
-def _get_base_url() -> str:
-    """Get and validate the NetBox base URL."""
     if not NETBOX_URL:
         raise RuntimeError(
             "NETBOX_URL environment variable is not set. "
             "Export it before running: export NETBOX_URL='https://netbox.example.com'"
         )
-    return NETBOX_URL.rstrip("/")
+
+
+# ---------------------------------------------------------------------------
+# NetBox API client
+# ---------------------------------------------------------------------------
+
+
+# One long-lived client shared by every tool call. Creating a client per
+# request paid a DNS lookup plus TCP and TLS handshakes each time; a shared
+# one keeps connections alive and reuses them across calls. HTTP/2 lets
+# concurrent calls (get_devices, get_prefix_utilization) share a single
+# connection as multiplexed streams.
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared NetBox client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _validate_env()
+        _CLIENT = httpx.AsyncClient(
+            base_url=_BASE_URL,
+            headers=_HEADERS,
+            timeout=30.0,
+            verify=True,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20, max_connections=50, keepalive_expiry=60
+            ),
+        )
+    return _CLIENT
+
+
+# Every tool is read-only, so identical GETs within the TTL can share one
+# response -- an agent re-asking about the same device or prefix costs
+# nothing. No lock: cache reads and writes never await, so they can't
+# interleave on the event loop.
+_CACHE: TTLCache | None = (
+    TTLCache(maxsize=256, ttl=NETBOX_CACHE_TTL) if NETBOX_CACHE_TTL > 0 else None
+)
+
+# Last ETag and parsed body per request, for conditional GETs once the TTL
+# entry has expired. If NetBox (or a proxy in front of it) sends ETags, an
+# unchanged resource comes back as an empty 304 and is not re-decoded.
+# An LRU bounds it, since every distinct filter combination is a new key.
+_ETAGS: LRUCache = LRUCache(maxsize=256)
 
 
 async def _netbox_get(path: str, params: dict[str, Any] | None = None) -> Any:
@@ -96,63 +162,97 @@ async def _netbox_get(path: str, params: dict[str, Any] | None = None) -> Any:
     Raises:
         RuntimeError: If the request fails or NetBox is unreachable
     """
-    url = f"{_get_base_url()}{path}"
-
-    async with httpx.AsyncClient(timeout=30.0, verify=True) as client:
-        try:
-            response = await client.get(url, headers=_get_headers(), params=params)
+    # List values (repeated filters like name=a&name=b) become tuples to hash
+    key = (
+        path,
+        tuple(sorted(
+            (k, tuple(v) if isinstance(v, list) else v) for k, v in (params or {}).items()
+        )),
+    )
+    if _CACHE is not None and key in _CACHE:
+        return _CACHE[key]
+
+    client = _get_client()
+    etag_entry = _ETAGS.get(key)
+    headers = {"If-None-Match": etag_entry[0]} if etag_entry else None
+
+    try:
+        response = await client.get(path, params=params, headers=headers)
+        if response.status_code == 304 and etag_entry:
+            data = etag_entry[1]
+        else:
             response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as exc:
-            status = exc.response.status_code
-            body = exc.response.text[:500]
-            if status == 401:
-                raise RuntimeError(
-                    "NetBox authentication failed (401). "
-                    "Check your NETBOX_TOKEN is valid."
-                ) from exc
-            elif status == 403:
-                raise RuntimeError(
-                    "NetBox permission denied (403). "
-                    "Your token may not have access to this endpoint."
-                ) from exc
-            elif status == 404:
-                raise RuntimeError(
-                    f"NetBox endpoint not found (404): {path}. "
-                    f"Check your NETBOX_URL and API path."
-                ) from exc
-            else:
-                raise RuntimeError(
-                    f"NetBox API error: {status} - {body}"
-                ) from exc
-        except httpx.ConnectError as exc:
+            # Parse the raw bytes directly -- skips httpx's text decode step
+            data = orjson.loads(response.content)
+            if etag := response.headers.get("ETag"):
+                _ETAGS[key] = (etag, data)
+    except httpx.HTTPStatusError as exc:
+        status = exc.response.status_code
+        body = exc.response.text[:500]
+        if status == 401:
             raise RuntimeError(
-                f"Cannot connect to NetBox at {_get_base_url()}. "
-                f"Check that NETBOX_URL is correct and the server is reachable. "
-                f"Error: {exc}"
+                "NetBox authentication failed (401). "
+                "Check your NETBOX_TOKEN is valid."
             ) from exc
-        except httpx.TimeoutException as exc:
+        elif status == 403:
             raise RuntimeError(
-                f"Request to NetBox timed out after 30s. "
-                f"The server may be slow or unreachable. URL: {url}"
+                "NetBox permission denied (403). "
+                "Your token may not have access to this endpoint."
             ) from exc
+        elif status == 404:
+            raise RuntimeError(
+                f"NetBox endpoint not found (404): {path}. "
+                f"Check your NETBOX_URL and API path."
+            ) from exc
+        else:
+            raise RuntimeError(
+                f"NetBox API error: {status} - {body}"
+            ) from exc
+    except httpx.ConnectError as exc:
+        raise RuntimeError(
+            f"Cannot connect to NetBox at {_BASE_URL}. "
+            f"Check that NETBOX_URL is correct and the server is reachable. "
+            f"Error: {exc}"
+        ) from exc
+    except httpx.TimeoutException as exc:
+        raise RuntimeError(
+            f"Request to NetBox timed out after 30s. "
+            f"The server may be slow or unreachable. URL: {exc.request.url}"
+        ) from exc
+
+    if _CACHE is not None:
+        _CACHE[key] = data
+    return data
 
 
 # ---------------------------------------------------------------------------
-# Helper: safely extract nested fields from NetBox responses
+# Helpers: encode responses
 # ---------------------------------------------------------------------------
 
 
-def _safe_nested(obj: dict | None, *keys: str, default: Any = None) -> Any:
-    """Safely traverse nested dicts. Returns default if any key is missing."""
-    current = obj
-    for key in keys:
-        if not isinstance(current, dict):
-            return default
-        current = current.get(key)
-        if current is None:
-            return default
-    return current
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response to JSON with orjson."""
+    return orjson.dumps(obj, option=_JSON_OPTION).decode()
+
+
+def _address_counts(total: int, used: int) -> tuple[int | str, int | str]:
+    """Return (total, available) as ints, or both as strings if total is too
+    large for orjson (e.g. IPv6 sizes), so the two fields always share a type."""
+    if total < 2**64:
+        return total, total - used
+    return str(total), str(total - used)
+
+
+# Usable IPv4 addresses per prefix length, indexed by CIDR (/0 to /32)
+_USABLE_V4: tuple[int, ...] = tuple(
+    # Standard subnets: subtract network and broadcast addresses
+    (1 << (32 - cidr)) - 2 if cidr <= 30
+    # Point-to-point links (RFC 3021)
+    else 2 if cidr == 31
+    # /32 host routes
+    else 1
+    for cidr in range(33)
+)
 
 
 # ---------------------------------------------------------------------------
@@ -164,6 +264,7 @@ def _safe_nested(obj: dict | None, *keys: str, default: Any = None) -> Any:
 async def list_devices(
     site: str | None = None,
     role: str | None = None,
+    hostnames: list[str] | None = None,
     limit: int = 50,
 ) -> str:
     """List network devices from NetBox inventory.
@@ -175,39 +276,36 @@ async def list_devices(
     Args:
         site: Filter by site slug (e.g., 'dc-east'). Optional.
         role: Filter by device role slug (e.g., 'core-router'). Optional.
+        hostnames: Only return these devices (exact names). Optional.
         limit: Maximum number of results. Default 50.
 
     Example questions this answers:
     - "What devices do we have?"
     - "Show me all devices at dc-east"
     - "List all core routers"
+    - "What are the primary IPs of switch-01 and switch-02?"
     """
-    params: dict[str, Any] = {"limit": limit}
+    # Skip the rendered config context -- usually the bulk of each device
+    # record, and never shown. (brief=true would also drop site/role/status.)
+    params: dict[str, Any] = {"limit": limit, "exclude": "config_context"}
     if site:
         params["site"] = site
     if role:
         params["role"] = role
+    if hostnames:
+        # NetBox ORs repeated filter values: ?name=a&name=b matches either
+        params["name"] = hostnames
 
     data = await _netbox_get("/api/dcim/devices/", params=params)
+    results = data.get("results") or ()
 
-    devices = []
-    for device in data.get("results", []):
-        devices.append({
-            "id": device["id"],
-            "hostname": device["name"],
-            "model": _safe_nested(device, "device_type", "display", default="Unknown"),
-            "site": _safe_nested(device, "site", "name", default="Unknown"),
-            "role": _safe_nested(device, "role", "name", default="Unknown"),
-            "status": _safe_nested(device, "status", "label", default="Unknown"),
-            "primary_ip": _safe_nested(device, "primary_ip", "address"),
-        })
-
-    result = {
+    devices = (device_summary(device) for device in results)
+
+    fields = {
         "count": data.get("count", 0),
-        "returned": len(devices),
-        "devices": devices,
+        "returned": len(results),
     }
-    return json.dumps(result, indent=2)
+    return _dumps({**fields, "devices": list(devices)})
 
 
 @mcp.tool()
@@ -236,33 +334,49 @@ async def get_device(hostname: str) -> str:
             f"Use list_devices to see available hostnames."
         )
 
-    device = results[0]
+    return _dumps(device_detail(results[0]))
 
-    info = {
-        "id": device["id"],
-        "hostname": device["name"],
-        "model": _safe_nested(device, "device_type", "display", default="Unknown"),
-        "manufacturer": _safe_nested(
-            device, "device_type", "manufacturer", "name", default="Unknown"
-        ),
-        "serial_number": device.get("serial", ""),
-        "asset_tag": device.get("asset_tag"),
-        "site": _safe_nested(device, "site", "name", default="Unknown"),
-        "rack": _safe_nested(device, "rack", "name"),
-        "position": device.get("position"),
-        "role": _safe_nested(device, "role", "name", default="Unknown"),
-        "status": _safe_nested(device, "status", "label", default="Unknown"),
-        "platform": _safe_nested(device, "platform", "name"),
-        "primary_ip": _safe_nested(device, "primary_ip", "address"),
-        "comments": device.get("comments", ""),
-        "tags": [tag["name"] for tag in device.get("tags", [])],
-        "url": device.get("url", ""),
-    }
-    return json.dumps(info, indent=2)
+
+@mcp.tool()
+async def get_devices(hostnames: list[str]) -> str:
+    """Get detailed information about several devices from NetBox at once.
+
+    Returns the same details as get_device for each hostname, fetched in a
+    single NetBox request. Use this instead of calling get_device repeatedly
+    when asked about more than one device.
+
+    Args:
+        hostnames: The exact hostnames (names) of the devices in NetBox.
+
+    Example questions this answers:
+    - "Compare router-core-01 and router-core-02"
+    - "What are the serial numbers of switch-access-01 and switch-access-02?"
+    """
+    names = list(dict.fromkeys(hostnames))  # drop duplicates, keep order
+    if not names:
+        # An empty name filter would make NetBox return every device
+        raise ValueError("Provide at least one hostname.")
+
+    # NetBox ORs repeated filter values: ?name=a&name=b matches either device
+    data = await _netbox_get(
+        "/api/dcim/devices/", params={"name": names, "limit": len(names)}
+    )
+
+    devices = {}
+    for device in data.get("results", []):
+        if device["name"] not in devices:
+            devices[device["name"]] = device_detail(device)
+    not_found = [name for name in names if name not in devices]
+
+    return _dumps({"devices": devices, "not_found": not_found})
 
 
 @mcp.tool()
-async def list_ip_addresses(prefix: str | None = None, limit: int = 50) -> str:
+async def list_ip_addresses(
+    prefix: str | None = None,
+    addresses: list[str] | None = None,
+    limit: int = 50,
+) -> str:
     """List IP addresses from NetBox IPAM.
 
     Returns IP addresses with their assignment status, DNS name, description,
@@ -272,49 +386,33 @@ async def list_ip_addresses(prefix: str | None = None, limit: int = 50) -> str:
     Args:
         prefix: Filter by parent prefix in CIDR notation (e.g., '10.0.0.0/24').
                 If omitted, returns IPs across all prefixes.
+        addresses: Only return these IP addresses (e.g., ['10.0.1.5/24']).
+                Optional.
         limit: Maximum number of results. Default 50.
 
     Example questions this answers:
     - "What IPs are in the 10.0.0.0/24 subnet?"
     - "Show me all assigned IP addresses"
     - "Where is 10.0.1.5 assigned?"
+    - "Where are 10.0.1.50 and 10.0.1.51 assigned?"
     """
     params: dict[str, Any] = {"limit": limit}
     if prefix:
         params["parent"] = prefix
+    if addresses:
+        params["address"] = addresses
 
     data = await _netbox_get("/api/ipam/ip-addresses/", params=params)
+    results = data.get("results") or ()
 
-    addresses = []
-    for ip in data.get("results", []):
-        # Determine what the IP is assigned to (device + interface)
-        assigned_to = None
-        assigned_obj = ip.get("assigned_object")
-        if assigned_obj:
-            device_name = _safe_nested(assigned_obj, "device", "name", default="")
-            iface_name = assigned_obj.get("name", "")
-            if device_name and iface_name:
-                assigned_to = f"{device_name} - {iface_name}"
-            elif device_name:
-                assigned_to = device_name
-
-        addresses.append({
-            "address": ip["address"],
-            "status": _safe_nested(ip, "status", "label", default="Unknown"),
-            "dns_name": ip.get("dns_name", ""),
-            "description": ip.get("description", ""),
-            "assigned_to": assigned_to,
-            "tenant": _safe_nested(ip, "tenant", "name"),
-            "vrf": _safe_nested(ip, "vrf", "name"),
-        })
-
-    result = {
+    rows = (ip_summary(ip) for ip in results)
+
+    fields = {
         "count": data.get("count", 0),
-        "returned": len(addresses),
+        "returned": len(results),
         "prefix_filter": prefix,
-        "addresses": addresses,
     }
-    return json.dumps(result, indent=2)
+    return _dumps({**fields, "addresses": list(rows)})
 
 
 @mcp.tool()
@@ -333,8 +431,17 @@ async def get_prefix_utilization(prefix: str) -> str:
     - "Do we have room in the server VLAN?"
     - "What is the utilization of our management prefix?"
     """
-    # Look up the prefix object
-    data = await _netbox_get("/api/ipam/prefixes/", params={"prefix": prefix})
+    # Look up the prefix object and count the child IP addresses assigned in
+    # it concurrently -- the count only needs the CIDR string. Only "count"
+    # is read from the second response, so ask for one brief record; limit=0
+    # would mean "no limit" to NetBox and return every IP in the prefix.
+    data, child_ips = await asyncio.gather(
+        _netbox_get("/api/ipam/prefixes/", params={"prefix": prefix}),
+        _netbox_get(
+            "/api/ipam/ip-addresses/",
+            params={"parent": prefix, "limit": 1, "brief": 1},
+        ),
+    )
 
     results = data.get("results", [])
     if not results:
@@ -345,26 +452,15 @@ async def get_prefix_utilization(prefix: str) -> str:
         )
 
     pfx = results[0]
-    prefix_id = pfx["id"]
-
-    # Get count of child IP addresses assigned in this prefix
-    child_ips = await _netbox_get(
-        "/api/ipam/ip-addresses/",
-        params={"parent": prefix, "limit": 1},
-    )
     total_ips_used = child_ips.get("count", 0)
 
-    # Calculate total usable addresses from CIDR
-    cidr = int(prefix.split("/")[1])
-    if cidr <= 30:
-        # Standard subnets: subtract network and broadcast addresses
-        total_addresses = (2 ** (32 - cidr)) - 2
-    elif cidr == 31:
-        # Point-to-point links (RFC 3021)
-        total_addresses = 2
+    # IPv4 sizes come from the usable-address table; IPv6 has no network or
+    # broadcast address to subtract, so every address in the prefix counts
+    net = ipaddress.ip_network(pfx["prefix"], strict=False)
+    if net.version == 4:
+        total_addresses = _USABLE_V4[net.prefixlen]
     else:
-        # /32 host routes
-        total_addresses = 1
+        total_addresses = net.num_addresses
 
     utilization_pct = (
         round((total_ips_used / total_addresses) * 100, 1)
@@ -372,21 +468,22 @@ async def get_prefix_utilization(prefix: str) -> str:
         else 0.0
     )
 
+    total_json, available_json = _address_counts(total_addresses, total_ips_used)
     info = {
         "prefix": pfx["prefix"],
         "description": pfx.get("description", ""),
-        "site": _safe_nested(pfx, "site", "name"),
-        "vlan": _safe_nested(pfx, "vlan", "display"),
-        "role": _safe_nested(pfx, "role", "name"),
-        "status": _safe_nested(pfx, "status", "label", default="Unknown"),
-        "tenant": _safe_nested(pfx, "tenant", "name"),
+        "site": safe_nested(pfx, "site", "name"),
+        "vlan": safe_nested(pfx, "vlan", "display"),
+        "role": safe_nested(pfx, "role", "name"),
+        "status": safe_nested(pfx, "status", "label", default="Unknown"),
+        "tenant": safe_nested(pfx, "tenant", "name"),
         "is_pool": pfx.get("is_pool", False),
-        "total_addresses": total_addresses,
+        "total_addresses": total_json,
         "ips_assigned": total_ips_used,
         "utilization_percent": utilization_pct,
-        "addresses_available": total_addresses - total_ips_used,
+        "addresses_available": available_json,
     }
-    return json.dumps(info, indent=2)
+    return _dumps(info)
 
 
 # ---------------------------------------------------------------------------
@@ -394,4 +491,6 @@ async def get_prefix_utilization(prefix: str) -> str:
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
+    # Fail at startup, not on the first tool call, if the env is incomplete
+    _validate_env()
     mcp.run(transport="stdio")
@@ -25,11 +25,12 @@ Usage
 
 Requirements
 ------------
-    pip install httpx
+    pip install "httpx[http2]"
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
 import sys
 from typing import Any
@@ -49,8 +50,14 @@ NETBOX_URL = NETBOX_URL.rstrip("/")
 
 # =============================================================================
 # HTTP client (re-used across all requests)
+#
+# Async so that independent requests within a phase (roles, primary-IP
+# assignments, ...) run concurrently instead of one round-trip at a time.
+# Phases that depend on each other still run in order. HTTP/2 multiplexes
+# those concurrent requests over one connection, and the pool is sized so
+# a fan-out never queues waiting for a free connection.
 # =============================================================================
-client = httpx.Client(
+client = httpx.AsyncClient(
     base_url=f"{NETBOX_URL}/api",
     headers={
         "Authorization": f"Token {NETBOX_TOKEN}",
@@ -58,6 +65,10 @@ client = httpx.Client(
         "Accept": "application/json",
     },
     timeout=30.0,
+    http2=True,
+    limits=httpx.Limits(
+        max_keepalive_connections=32, max_connections=64, keepalive_expiry=120
+    ),
 )
 
 
@@ -65,12 +76,43 @@ client = httpx.Client(
 # Helper utilities
 # =============================================================================
 
+# Status lines are buffered and written in one go at each phase boundary,
+# so concurrent tasks within a phase never block on, or interleave, stdout.
+_LOG_BUFFER: list[str] = []
+
+
 def _log(msg: str) -> None:
-    """Print a timestamped status line."""
-    print(f"  -> {msg}")
+    """Queue a status line for the next _flush_log()."""
+    _LOG_BUFFER.append(f"  -> {msg}\n")
+
+
+def _flush_log() -> None:
+    """Write all queued status lines to stdout with a single write."""
+    if _LOG_BUFFER:
+        sys.stdout.write("".join(_LOG_BUFFER))
+        _LOG_BUFFER.clear()
+
+
+def _phase(title: str) -> None:
+    """Flush the previous phase's status lines and print the next header."""
+    _flush_log()
+    print(f"\n{title}")
+
 
+# Every object _get_or_create has found or created this run, keyed by
+# (endpoint, lookup params). Later phases read objects from here instead
+# of querying NetBox again for something this run just wrote.
+_SEEN: dict[tuple[str, frozenset[tuple[str, Any]]], dict[str, Any]] = {}
 
-def _get_or_create(
+
+def _seen_key(
+    endpoint: str, lookup_params: dict[str, Any]
+) -> tuple[str, frozenset[tuple[str, Any]]]:
+    """Build the _SEEN key for an endpoint + lookup."""
+    return endpoint, frozenset(lookup_params.items())
+
+
+async def _get_or_create(
     endpoint: str,
     lookup_params: dict[str, Any],
     create_payload: dict[str, Any],
@@ -95,64 +137,101 @@ def _get_or_create(
     dict
         The existing or newly-created object (JSON).
     """
+    key = _seen_key(endpoint, lookup_params)
+    if key in _SEEN:
+        return _SEEN[key]
+
     # --- Check if the object already exists ----------------------------------
-    resp = client.get(endpoint, params=lookup_params)
+    resp = await client.get(endpoint, params=lookup_params)
     resp.raise_for_status()
     results = resp.json().get("results", [])
     if results:
         _log(f"EXISTS  {label}")
+        _SEEN[key] = results[0]
         return results[0]
 
     # --- Create it -----------------------------------------------------------
-    resp = client.post(endpoint, json=create_payload)
+    resp = await client.post(endpoint, json=create_payload)
     if resp.status_code in (200, 201):
         _log(f"CREATE  {label}")
-        return resp.json()
+        _SEEN[key] = resp.json()
+        return _SEEN[key]
 
     # Provide a useful error message and bail out.
+    _flush_log()
     print(f"  !! FAILED to create {label}: {resp.status_code}", file=sys.stderr)
     print(f"     {resp.text}", file=sys.stderr)
     resp.raise_for_status()
     return {}  # unreachable, keeps mypy happy
 
 
-def _get_or_create_ip(
-    address: str,
-    status: str = "active",
-    description: str = "",
-    assigned_object_type: str | None = None,
-    assigned_object_id: int | None = None,
-) -> dict[str, Any]:
+async def _bulk_create(
+    endpoint: str,
+    payloads: list[dict[str, Any]],
+    lookup_key: str,
+    label: str,
+) -> dict[str, dict[str, Any]]:
     """
-    Convenience wrapper for creating an IP address.
+    Idempotent bulk create: one GET to find what exists, one POST for the rest.
 
-    NetBox expects CIDR notation for IP addresses (e.g. "10.0.1.10/24").
+    Parameters
+    ----------
+    endpoint : str
+        API path relative to /api  (e.g. "/ipam/ip-addresses/").
+    payloads : list of dict
+        Full JSON bodies, one per object.
+    lookup_key : str
+        Payload field that identifies an object and is also a NetBox filter
+        (e.g. "address", "prefix", "name").
+    label : str
+        Log label with a ``{}`` placeholder for the lookup value.
+
+    Returns
+    -------
+    dict
+        Existing or newly-created objects, keyed by their lookup value.
     """
-    payload: dict[str, Any] = {
-        "address": address,
-        "status": status,
-        "description": description,
-    }
-    if assigned_object_type and assigned_object_id:
-        payload["assigned_object_type"] = assigned_object_type
-        payload["assigned_object_id"] = assigned_object_id
-
-    return _get_or_create(
-        "/ipam/ip-addresses/",
-        {"address": address},
-        payload,
-        f"IP {address}",
-    )
+    values = [payload[lookup_key] for payload in payloads]
+
+    # --- Find the ones that already exist ------------------------------------
+    # NetBox ORs repeated filter params: ?address=a&address=b matches either.
+    resp = await client.get(endpoint, params={lookup_key: values, "limit": len(values)})
+    resp.raise_for_status()
+    found = {obj[lookup_key]: obj for obj in resp.json().get("results", [])}
+    for value in values:
+        if value in found:
+            _log(f"EXISTS  {label.format(value)}")
+
+    # --- Create the rest with a single array POST ----------------------------
+    missing = [payload for payload in payloads if payload[lookup_key] not in found]
+    if missing:
+        resp = await client.post(endpoint, json=missing)
+        if resp.status_code not in (200, 201):
+            _flush_log()
+            print(
+                f"  !! FAILED to bulk-create {len(missing)} objects at {endpoint}: "
+                f"{resp.status_code}",
+                file=sys.stderr,
+            )
+            print(f"     {resp.text}", file=sys.stderr)
+            resp.raise_for_status()
+        for obj in resp.json():
+            _log(f"CREATE  {label.format(obj[lookup_key])}")
+            found[obj[lookup_key]] = obj
+
+    for value, obj in found.items():
+        _SEEN[_seen_key(endpoint, {lookup_key: value})] = obj
+    return found
 
 
 # =============================================================================
 # Seed functions — called in dependency order
 # =============================================================================
 
-def create_site() -> dict[str, Any]:
+async def create_site() -> dict[str, Any]:
     """Create the lab site."""
-    print("\n[1/8] Site")
-    return _get_or_create(
+    _phase("[1/8] Site")
+    return await _get_or_create(
         "/dcim/sites/",
         {"name": "Lab"},
         {"name": "Lab", "slug": "lab", "status": "active"},
@@ -160,10 +239,10 @@ def create_site() -> dict[str, Any]:
     )
 
 
-def create_manufacturer() -> dict[str, Any]:
+async def create_manufacturer() -> dict[str, Any]:
     """Create the Arista manufacturer."""
-    print("\n[2/8] Manufacturer")
-    return _get_or_create(
+    _phase("[2/8] Manufacturer")
+    return await _get_or_create(
         "/dcim/manufacturers/",
         {"name": "Arista"},
         {"name": "Arista", "slug": "arista"},
@@ -171,10 +250,10 @@ def create_manufacturer() -> dict[str, Any]:
     )
 
 
-def create_device_type(manufacturer_id: int) -> dict[str, Any]:
+async def create_device_type(manufacturer_id: int) -> dict[str, Any]:
     """Create the cEOS device type under Arista."""
-    print("\n[3/8] Device Type")
-    return _get_or_create(
+    _phase("[3/8] Device Type")
+    return await _get_or_create(
         "/dcim/device-types/",
         {"model": "cEOS"},
         {
@@ -186,45 +265,43 @@ def create_device_type(manufacturer_id: int) -> dict[str, Any]:
     )
 
 
-def create_device_roles() -> dict[str, dict[str, Any]]:
+async def create_device_roles() -> dict[str, dict[str, Any]]:
     """Create 'switch' and 'router' device roles."""
-    print("\n[4/8] Device Roles")
-    roles = {}
-    for name, color in [("switch", "0000ff"), ("router", "ff0000")]:
-        roles[name] = _get_or_create(
+    _phase("[4/8] Device Roles")
+    colors = {"switch": "0000ff", "router": "ff0000"}
+    results = await asyncio.gather(*(
+        _get_or_create(
             "/dcim/device-roles/",
             {"name": name},
             {"name": name, "slug": name, "color": color, "vm_role": False},
             f"Role '{name}'",
         )
-    return roles
+        for name, color in colors.items()
+    ))
+    return dict(zip(colors, results))
 
 
-def create_devices(
+async def create_devices(
     site_id: int,
     device_type_id: int,
     role_id: int,
 ) -> dict[str, dict[str, Any]]:
     """Create the three cEOS switches."""
-    print("\n[5/8] Devices")
-    devices: dict[str, dict[str, Any]] = {}
-    for name in ("switch-01", "switch-02", "switch-03"):
-        devices[name] = _get_or_create(
-            "/dcim/devices/",
-            {"name": name},
-            {
-                "name": name,
-                "site": site_id,
-                "device_type": device_type_id,
-                "role": role_id,
-                "status": "active",
-            },
-            f"Device '{name}'",
-        )
-    return devices
+    _phase("[5/8] Devices")
+    payloads = [
+        {
+            "name": name,
+            "site": site_id,
+            "device_type": device_type_id,
+            "role": role_id,
+            "status": "active",
+        }
+        for name in ("switch-01", "switch-02", "switch-03")
+    ]
+    return await _bulk_create("/dcim/devices/", payloads, "name", "Device '{}'")
 
 
-def create_prefixes() -> None:
+async def create_prefixes() -> None:
     """
     Create IP prefixes for the lab.
 
@@ -237,7 +314,7 @@ def create_prefixes() -> None:
       10.0.23.0/30    — switch-02 <-> switch-03 p2p
       10.0.13.0/30    — switch-01 <-> switch-03 p2p
     """
-    print("\n[6/8] Prefixes")
+    _phase("[6/8] Prefixes")
     prefixes = [
         ("172.20.20.0/24", "Management network (lab-net)"),
         ("10.0.1.0/24", "Server / host subnet (mixed live + stale IPs)"),
@@ -245,16 +322,14 @@ def create_prefixes() -> None:
         ("10.0.23.0/30", "P2P: switch-02 <-> switch-03"),
         ("10.0.13.0/30", "P2P: switch-01 <-> switch-03"),
     ]
-    for prefix, desc in prefixes:
-        _get_or_create(
-            "/ipam/prefixes/",
-            {"prefix": prefix},
-            {"prefix": prefix, "status": "active", "description": desc},
-            f"Prefix {prefix}",
-        )
+    payloads = [
+        {"prefix": prefix, "status": "active", "description": desc}
+        for prefix, desc in prefixes
+    ]
+    await _bulk_create("/ipam/prefixes/", payloads, "prefix", "Prefix {}")
 
 
-def create_ip_addresses() -> None:
+async def create_ip_addresses() -> None:
     """
     Create all lab IP addresses.
 
@@ -266,58 +341,57 @@ def create_ip_addresses() -> None:
       STALE IPs  — exist ONLY in NetBox.  No ARP entry, no host.
                    The agent should flag these as unreachable / stale.
     """
-    print("\n[7/8] IP Addresses")
-
-    # --- Management IPs ------------------------------------------------------
-    _log("Management IPs...")
-    _get_or_create_ip("172.20.20.11/24", description="switch-01 Management0")
-    _get_or_create_ip("172.20.20.12/24", description="switch-02 Management0")
-    _get_or_create_ip("172.20.20.13/24", description="switch-03 Management0")
-
-    # --- Loopback IPs --------------------------------------------------------
-    _log("Loopback IPs...")
-    _get_or_create_ip("10.0.0.1/32", description="switch-01 Loopback0")
-    _get_or_create_ip("10.0.0.2/32", description="switch-02 Loopback0")
-    _get_or_create_ip("10.0.0.3/32", description="switch-03 Loopback0")
-
-    # --- Point-to-point link IPs ---------------------------------------------
-    _log("Point-to-point link IPs...")
-    _get_or_create_ip("10.0.12.1/30", description="switch-01 eth1 (-> sw02)")
-    _get_or_create_ip("10.0.12.2/30", description="switch-02 eth1 (-> sw01)")
-    _get_or_create_ip("10.0.23.1/30", description="switch-02 eth2 (-> sw03)")
-    _get_or_create_ip("10.0.23.2/30", description="switch-03 eth1 (-> sw02)")
-    _get_or_create_ip("10.0.13.1/30", description="switch-01 eth2 (-> sw03)")
-    _get_or_create_ip("10.0.13.2/30", description="switch-03 eth2 (-> sw01)")
-
-    # --- Server subnet: LIVE IPs (have ARP entries on switches) --------------
-    _log("Server subnet — LIVE IPs (will answer pings)...")
-    # switch-01 ARP table
-    _get_or_create_ip("10.0.1.10/24", description="Live host (switch-01 ARP)")
-    _get_or_create_ip("10.0.1.11/24", description="Live host (switch-01 ARP)")
-    _get_or_create_ip("10.0.1.12/24", description="Live host (switch-01 ARP)")
-    # switch-02 ARP table
-    _get_or_create_ip("10.0.1.20/24", description="Live host (switch-02 ARP)")
-    _get_or_create_ip("10.0.1.21/24", description="Live host (switch-02 ARP)")
-    # switch-03 ARP table
-    _get_or_create_ip("10.0.1.30/24", description="Live host (switch-03 ARP)")
-
-    # --- Server subnet: STALE IPs (exist ONLY in NetBox — no ARP entry) ------
-    _log("Server subnet — STALE IPs (NetBox-only, no ARP on any switch)...")
-    _get_or_create_ip("10.0.1.50/24", description="Stale — no matching ARP entry")
-    _get_or_create_ip("10.0.1.51/24", description="Stale — no matching ARP entry")
-    _get_or_create_ip("10.0.1.52/24", description="Stale — no matching ARP entry")
-    _get_or_create_ip("10.0.1.100/24", description="Stale — no matching ARP entry")
-    _get_or_create_ip("10.0.1.101/24", description="Stale — no matching ARP entry")
-
-
-def assign_primary_ips(devices: dict[str, dict[str, Any]]) -> None:
+    _phase("[7/8] IP Addresses")
+
+    # NetBox expects CIDR notation for IP addresses (e.g. "10.0.1.10/24").
+    ips = [
+        # --- Management IPs --------------------------------------------------
+        ("172.20.20.11/24", "switch-01 Management0"),
+        ("172.20.20.12/24", "switch-02 Management0"),
+        ("172.20.20.13/24", "switch-03 Management0"),
+        # --- Loopback IPs ----------------------------------------------------
+        ("10.0.0.1/32", "switch-01 Loopback0"),
+        ("10.0.0.2/32", "switch-02 Loopback0"),
+        ("10.0.0.3/32", "switch-03 Loopback0"),
+        # --- Point-to-point link IPs -----------------------------------------
+        ("10.0.12.1/30", "switch-01 eth1 (-> sw02)"),
+        ("10.0.12.2/30", "switch-02 eth1 (-> sw01)"),
+        ("10.0.23.1/30", "switch-02 eth2 (-> sw03)"),
+        ("10.0.23.2/30", "switch-03 eth1 (-> sw02)"),
+        ("10.0.13.1/30", "switch-01 eth2 (-> sw03)"),
+        ("10.0.13.2/30", "switch-03 eth2 (-> sw01)"),
+        # --- Server subnet: LIVE IPs (have ARP entries on switches) ----------
+        # switch-01 ARP table
+        ("10.0.1.10/24", "Live host (switch-01 ARP)"),
+        ("10.0.1.11/24", "Live host (switch-01 ARP)"),
+        ("10.0.1.12/24", "Live host (switch-01 ARP)"),
+        # switch-02 ARP table
+        ("10.0.1.20/24", "Live host (switch-02 ARP)"),
+        ("10.0.1.21/24", "Live host (switch-02 ARP)"),
+        # switch-03 ARP table
+        ("10.0.1.30/24", "Live host (switch-03 ARP)"),
+        # --- Server subnet: STALE IPs (exist ONLY in NetBox — no ARP entry) --
+        ("10.0.1.50/24", "Stale — no matching ARP entry"),
+        ("10.0.1.51/24", "Stale — no matching ARP entry"),
+        ("10.0.1.52/24", "Stale — no matching ARP entry"),
+        ("10.0.1.100/24", "Stale — no matching ARP entry"),
+        ("10.0.1.101/24", "Stale — no matching ARP entry"),
+    ]
+    payloads = [
+        {"address": address, "status": "active", "description": desc}
+        for address, desc in ips
+    ]
+    await _bulk_create("/ipam/ip-addresses/", payloads, "address", "IP {}")
+
+
+async def assign_primary_ips(devices: dict[str, dict[str, Any]]) -> None:
     """
     Assign management IPs as the primary IP for each device.
 
     This allows NetBox to display the management address on the device
     detail page and makes the devices queryable by IP.
     """
-    print("\n[8/8] Assigning primary IPs to devices")
+    _phase("[8/8] Assigning primary IPs to devices")
 
     mgmt_map = {
         "switch-01": "172.20.20.11/24",
@@ -325,58 +399,78 @@ def assign_primary_ips(devices: dict[str, dict[str, Any]]) -> None:
         "switch-03": "172.20.20.13/24",
     }
 
-    for device_name, mgmt_address in mgmt_map.items():
-        device = devices[device_name]
-        device_id = device["id"]
-
-        # Look up the IP address object.
-        resp = client.get("/ipam/ip-addresses/", params={"address": mgmt_address})
-        resp.raise_for_status()
-        results = resp.json().get("results", [])
-        if not results:
-            _log(f"SKIP    {device_name} — IP {mgmt_address} not found")
-            continue
+    # Each device's lookups and patches are independent of the others.
+    await asyncio.gather(*(
+        _assign_primary_ip(device_name, devices[device_name]["id"], mgmt_address)
+        for device_name, mgmt_address in mgmt_map.items()
+    ))
 
-        ip_id = results[0]["id"]
 
-        # Look up the Management0 interface on the device.
-        intf_resp = client.get(
-            "/dcim/interfaces/",
-            params={"device_id": device_id, "name": "Management0"},
+async def _get_results(endpoint: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+    """GET a NetBox list endpoint and return its results, raising on errors."""
+    resp = await client.get(endpoint, params=params)
+    resp.raise_for_status()
+    return resp.json().get("results", [])
+
+
+async def _assign_primary_ip(device_name: str, device_id: int, mgmt_address: str) -> None:
+    """Assign one management IP to its device's Management0 and primary_ip4."""
+    # The IP was created (or found) in phase 7, so it normally comes from
+    # _SEEN and only the Management0 interface needs a lookup. Otherwise
+    # both lookups are independent and run concurrently.
+    ip_obj = _SEEN.get(_seen_key("/ipam/ip-addresses/", {"address": mgmt_address}))
+    intf_params = {"device_id": device_id, "name": "Management0"}
+    if ip_obj is None:
+        intf_results, ip_results = await asyncio.gather(
+            _get_results("/dcim/interfaces/", intf_params),
+            _get_results("/ipam/ip-addresses/", {"address": mgmt_address}),
         )
-        intf_resp.raise_for_status()
-        intf_results = intf_resp.json().get("results", [])
-
-        # If the interface exists, assign the IP to it.
-        if intf_results:
-            intf_id = intf_results[0]["id"]
-            client.patch(
-                f"/ipam/ip-addresses/{ip_id}/",
-                json={
-                    "assigned_object_type": "dcim.interface",
-                    "assigned_object_id": intf_id,
-                },
-            )
-
-        # Set the device's primary_ip4 field.
-        patch_resp = client.patch(
-            f"/dcim/devices/{device_id}/",
-            json={"primary_ip4": ip_id},
+        if not ip_results:
+            _log(f"SKIP    {device_name} — IP {mgmt_address} not found")
+            return
+        ip_obj = ip_results[0]
+    else:
+        intf_results = await _get_results("/dcim/interfaces/", intf_params)
+
+    ip_id = ip_obj["id"]
+
+    # If the interface exists, assign the IP to it.
+    if intf_results:
+        intf_id = intf_results[0]["id"]
+        assign_resp = await client.patch(
+            f"/ipam/ip-addresses/{ip_id}/",
+            json={
+                "assigned_object_type": "dcim.interface",
+                "assigned_object_id": intf_id,
+            },
         )
-        if patch_resp.status_code == 200:
-            _log(f"ASSIGN  {device_name} -> {mgmt_address}")
-        else:
+        # NetBox only accepts a primary IP that is assigned to the device
+        if assign_resp.status_code != 200:
             _log(
-                f"WARN    Could not assign primary IP for {device_name}: "
-                f"{patch_resp.status_code}"
+                f"WARN    Could not assign {mgmt_address} to {device_name} "
+                f"Management0: {assign_resp.status_code}"
             )
+            return
+
+    # Set the device's primary_ip4 field.
+    patch_resp = await client.patch(
+        f"/dcim/devices/{device_id}/",
+        json={"primary_ip4": ip_id},
+    )
+    if patch_resp.status_code == 200:
+        _log(f"ASSIGN  {device_name} -> {mgmt_address}")
+    else:
+        _log(
+            f"WARN    Could not assign primary IP for {device_name}: "
+            f"{patch_resp.status_code}"
+        )
 
 
 # =============================================================================
 # Main entry point
 # =============================================================================
 
-def main() -> None:
+async def main() -> None:
     """Run the full seed sequence."""
     print("=" * 60)
     print("  NetBox Lab Seeder")
@@ -387,9 +481,10 @@ def main() -> None:
     # Use /dcim/sites/ as the health check endpoint since /status/ requires
     # authentication in newer NetBox versions.
     try:
-        health = client.get("/dcim/sites/")
+        health = await client.get("/dcim/sites/")
         health.raise_for_status()
         _log(f"NetBox is reachable (HTTP {health.status_code})")
+        _flush_log()
     except httpx.HTTPError as exc:
         print(
             f"\n  !! Cannot reach NetBox at {NETBOX_URL}/api/dcim/sites/\n"
@@ -400,14 +495,21 @@ def main() -> None:
         sys.exit(1)
 
     # Seed in dependency order.
-    site = create_site()
-    manufacturer = create_manufacturer()
-    device_type = create_device_type(manufacturer["id"])
-    roles = create_device_roles()
-    devices = create_devices(site["id"], device_type["id"], roles["switch"]["id"])
-    create_prefixes()
-    create_ip_addresses()
-    assign_primary_ips(devices)
+    try:
+        site = await create_site()
+        manufacturer = await create_manufacturer()
+        device_type = await create_device_type(manufacturer["id"])
+        roles = await create_device_roles()
+        devices = await create_devices(
+            site["id"], device_type["id"], roles["switch"]["id"]
+        )
+        await create_prefixes()
+        await create_ip_addresses()
+        await assign_primary_ips(devices)
+    finally:
+        # Show whatever progress was made, even if a phase failed.
+        _flush_log()
+        await client.aclose()
 
     print("\n" + "=" * 60)
     print("  Seeding complete!")
@@ -419,4 +521,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())